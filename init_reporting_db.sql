@@ -1,4 +1,6 @@
 -- Reporting Service Database Schema
+-- Current schema in one file: what migrations/001 plus every later migration produce,
+-- with the same index names. Use it instead of the migrations, not before them.
 
 -- Report Templates Table
 CREATE TABLE IF NOT EXISTS report_templates (
@@ -6,16 +8,17 @@ CREATE TABLE IF NOT EXISTS report_templates (
     template_name VARCHAR(100) NOT NULL UNIQUE,
     template_type VARCHAR(50) NOT NULL,
     description TEXT,
-    sections LONGTEXT,
-    export_formats LONGTEXT,
-    is_default TINYINT DEFAULT 0,
-    is_active TINYINT DEFAULT 1,
+    sections JSON,
+    export_formats JSON,
+    is_default BOOLEAN NOT NULL DEFAULT FALSE,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    is_deleted TINYINT DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     deleted_at TIMESTAMP NULL,
-    INDEX idx_report_templates_type_active (template_type, is_active),
-    INDEX idx_report_templates_name (template_name)
+    INDEX idx_type_active (template_type, is_active),
+    INDEX idx_template_name (template_name),
+    INDEX idx_is_deleted (is_deleted)
 );
 
 -- Reports Table
@@ -36,16 +39,18 @@ CREATE TABLE IF NOT EXISTS reports (
     file_path VARCHAR(500),
     file_size INT,
     error_message TEXT,
-    filters LONGTEXT,
+    filters JSON,
     generated_by VARCHAR(50) DEFAULT 'manual',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    is_deleted TINYINT DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     deleted_at TIMESTAMP NULL,
     FOREIGN KEY (template_id) REFERENCES report_templates(id),
-    INDEX idx_reports_user_status (user_id, status),
-    INDEX idx_reports_type_created (report_type, created_at),
-    INDEX idx_reports_generated_status (generated_at, status)
+    INDEX idx_user_status (user_id, is_deleted, status, created_at),
+    INDEX idx_type_created (report_type, created_at),
+    INDEX idx_generated_status (generated_at, status),
+    INDEX idx_user_created (user_id, is_deleted, created_at, id),
+    INDEX idx_is_deleted (is_deleted)
 );
 
 -- Report Schedules Table
@@ -57,9 +62,9 @@ CREATE TABLE IF NOT EXISTS report_schedules (
     frequency VARCHAR(50) NOT NULL,
     time_of_day VARCHAR(10) NOT NULL,
     timezone VARCHAR(50) DEFAULT 'UTC',
-    recipients LONGTEXT,
+    recipients JSON,
     delivery_method VARCHAR(50) DEFAULT 'email',
-    is_enabled TINYINT DEFAULT 1,
+    is_enabled BOOLEAN NOT NULL DEFAULT TRUE,
     next_run_at DATETIME,
     last_run_at TIMESTAMP NULL,
     run_count INT DEFAULT 0,
@@ -67,11 +72,14 @@ CREATE TABLE IF NOT EXISTS report_schedules (
     failure_count INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    is_deleted TINYINT DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     deleted_at TIMESTAMP NULL,
     FOREIGN KEY (template_id) REFERENCES report_templates(id),
-    INDEX idx_report_schedules_user_enabled (user_id, is_enabled),
-    INDEX idx_report_schedules_next_run (next_run_at)
+    INDEX idx_user_enabled (user_id, is_enabled),
+    INDEX idx_next_run (next_run_at),
+    INDEX idx_due (is_enabled, is_deleted, next_run_at),
+    INDEX idx_user_created (user_id, is_deleted, created_at, id),
+    INDEX idx_is_deleted (is_deleted)
 );
 
 -- Report Exports Table
@@ -81,7 +89,7 @@ CREATE TABLE IF NOT EXISTS report_exports (
     export_format VARCHAR(50) NOT NULL,
     file_path VARCHAR(500) NOT NULL,
     file_size INT,
-    file_hash VARCHAR(128),
+    file_hash BINARY(32),
     export_status VARCHAR(50) DEFAULT 'pending',
     exported_at TIMESTAMP NULL,
     download_count INT DEFAULT 0,
@@ -90,11 +98,12 @@ CREATE TABLE IF NOT EXISTS report_exports (
     compression VARCHAR(50),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    is_deleted TINYINT DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     deleted_at TIMESTAMP NULL,
     FOREIGN KEY (report_id) REFERENCES reports(id),
-    INDEX idx_report_exports_report_format (report_id, export_format),
-    INDEX idx_report_exports_status (export_status)
+    INDEX idx_report_format (report_id, export_format),
+    INDEX idx_status (export_status),
+    INDEX idx_is_deleted (is_deleted)
 );
 
 -- Report Metrics Table
@@ -108,11 +117,13 @@ CREATE TABLE IF NOT EXISTS report_metrics (
     recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    is_deleted TINYINT DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     deleted_at TIMESTAMP NULL,
     FOREIGN KEY (report_id) REFERENCES reports(id),
-    INDEX idx_report_metrics_report_name (report_id, metric_name),
-    INDEX idx_report_metrics_category (metric_category)
+    INDEX idx_report_name (report_id, metric_name),
+    INDEX idx_category (metric_category),
+    INDEX idx_name_recorded (metric_name, is_deleted, recorded_at, metric_value),
+    INDEX idx_is_deleted (is_deleted)
 );
 
 -- Report Access Logs Table
@@ -129,11 +140,14 @@ CREATE TABLE IF NOT EXISTS report_access_logs (
     accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    is_deleted TINYINT DEFAULT 0,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     deleted_at TIMESTAMP NULL,
     FOREIGN KEY (report_id) REFERENCES reports(id),
-    INDEX idx_report_access_logs_report_user (report_id, user_id),
-    INDEX idx_report_access_logs_type_date (access_type, accessed_at)
+    INDEX idx_report_user (report_id, user_id),
+    INDEX idx_report_accessed (report_id, is_deleted, accessed_at),
+    INDEX idx_user_accessed (user_id, is_deleted, accessed_at),
+    INDEX idx_type_date (access_type, accessed_at),
+    INDEX idx_is_deleted (is_deleted)
 );
 
 -- Sample Data
@@ -0,0 +1,42 @@
+-- NILBX Reporting Service - Boolean flag columns
+-- Database: reporting_db
+-- Purpose: Make the 0/1 flag columns NOT NULL booleans to match the ORM models
+
+USE reporting_db;
+
+-- ====================================
+-- Backfill NULL flags
+-- ====================================
+UPDATE report_templates SET is_default = FALSE WHERE is_default IS NULL;
+UPDATE report_templates SET is_active = TRUE WHERE is_active IS NULL;
+UPDATE report_templates SET is_deleted = FALSE WHERE is_deleted IS NULL;
+UPDATE reports SET is_deleted = FALSE WHERE is_deleted IS NULL;
+UPDATE report_schedules SET is_enabled = TRUE WHERE is_enabled IS NULL;
+UPDATE report_schedules SET is_deleted = FALSE WHERE is_deleted IS NULL;
+UPDATE report_exports SET is_deleted = FALSE WHERE is_deleted IS NULL;
+UPDATE report_metrics SET is_deleted = FALSE WHERE is_deleted IS NULL;
+UPDATE report_access_logs SET is_deleted = FALSE WHERE is_deleted IS NULL;
+
+-- ====================================
+-- Tighten column definitions
+-- ====================================
+ALTER TABLE report_templates
+    MODIFY is_default BOOLEAN NOT NULL DEFAULT FALSE,
+    MODIFY is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    MODIFY is_deleted BOOLEAN NOT NULL DEFAULT FALSE;
+
+ALTER TABLE reports
+    MODIFY is_deleted BOOLEAN NOT NULL DEFAULT FALSE;
+
+ALTER TABLE report_schedules
+    MODIFY is_enabled BOOLEAN NOT NULL DEFAULT TRUE,
+    MODIFY is_deleted BOOLEAN NOT NULL DEFAULT FALSE;
+
+ALTER TABLE report_exports
+    MODIFY is_deleted BOOLEAN NOT NULL DEFAULT FALSE;
+
+ALTER TABLE report_metrics
+    MODIFY is_deleted BOOLEAN NOT NULL DEFAULT FALSE;
+
+ALTER TABLE report_access_logs
+    MODIFY is_deleted BOOLEAN NOT NULL DEFAULT FALSE;
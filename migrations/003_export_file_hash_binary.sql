@@ -0,0 +1,17 @@
+-- NILBX Reporting Service - Binary export file hashes
+-- Database: reporting_db
+-- Purpose: Store report_exports.file_hash as the raw 32-byte SHA-256 digest instead of hex text
+
+USE reporting_db;
+
+-- ====================================
+-- Convert hex digests to BINARY(32)
+-- ====================================
+ALTER TABLE report_exports ADD COLUMN file_hash_bin BINARY(32) NULL AFTER file_hash;
+
+UPDATE report_exports
+SET file_hash_bin = UNHEX(file_hash)
+WHERE file_hash REGEXP '^[0-9A-Fa-f]{64}$';
+
+ALTER TABLE report_exports DROP COLUMN file_hash;
+ALTER TABLE report_exports RENAME COLUMN file_hash_bin TO file_hash;
@@ -0,0 +1,25 @@
+-- NILBX Reporting Service - Indexes for hot list/scheduler predicates
+-- Database: reporting_db
+-- Purpose: Serve the soft-delete filtered lookups with index seeks instead of scans.
+-- MySQL has no partial indexes, so is_deleted is carried as a key column.
+
+USE reporting_db;
+
+-- ====================================
+-- Reports: user listing, optionally by status, newest first
+-- ====================================
+ALTER TABLE reports
+    DROP INDEX idx_user_status,
+    ADD INDEX idx_user_status (user_id, is_deleted, status, created_at);
+
+-- ====================================
+-- Report Schedules: due-for-execution scan
+-- ====================================
+ALTER TABLE report_schedules
+    ADD INDEX idx_due (is_enabled, is_deleted, next_run_at);
+
+-- ====================================
+-- Report Metrics: averages by metric name over a time window
+-- ====================================
+ALTER TABLE report_metrics
+    ADD INDEX idx_name_recorded (metric_name, is_deleted, recorded_at);
@@ -0,0 +1,13 @@
+-- NILBX Reporting Service - Covering index for metric averages
+-- Database: reporting_db
+-- Purpose: Let AVG/MIN/MAX/COUNT over a metric name and time window be answered
+-- from the index alone, without reading report_metrics rows.
+
+USE reporting_db;
+
+-- ====================================
+-- Report Metrics: carry metric_value in the name/window index
+-- ====================================
+ALTER TABLE report_metrics
+    DROP INDEX idx_name_recorded,
+    ADD INDEX idx_name_recorded (metric_name, is_deleted, recorded_at, metric_value);
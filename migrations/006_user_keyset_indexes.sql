@@ -0,0 +1,18 @@
+-- NILBX Reporting Service - Indexes for keyset pagination of user listings
+-- Database: reporting_db
+-- Purpose: Seek straight to the next (created_at, id) page of a user's reports and
+-- schedules instead of reading and discarding OFFSET rows.
+
+USE reporting_db;
+
+-- ====================================
+-- Reports: user listing, newest first, continued after a (created_at, id) cursor
+-- ====================================
+ALTER TABLE reports
+    ADD INDEX idx_user_created (user_id, is_deleted, created_at, id);
+
+-- ====================================
+-- Report Schedules: same cursor over a user's schedules
+-- ====================================
+ALTER TABLE report_schedules
+    ADD INDEX idx_user_created (user_id, is_deleted, created_at, id);
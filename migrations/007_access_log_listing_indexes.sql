@@ -0,0 +1,13 @@
+-- NILBX Reporting Service - Indexes for access-log listings
+-- Database: reporting_db
+-- Purpose: Read a report's or a user's access logs newest first straight off an
+-- index range instead of sorting every matching row.
+
+USE reporting_db;
+
+-- ====================================
+-- Report Access Logs: per-report and per-user pages by accessed_at
+-- ====================================
+ALTER TABLE report_access_logs
+    ADD INDEX idx_report_accessed (report_id, is_deleted, accessed_at),
+    ADD INDEX idx_user_accessed (user_id, is_deleted, accessed_at);
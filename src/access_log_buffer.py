@@ -0,0 +1,138 @@
+"""
+Reporting Service - Buffered Access Logging
+
+Accumulates report access rows in memory and writes them in batches from a
+background thread, so read endpoints don't pay an INSERT + COMMIT per view.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from .reporting_service import ReportAccessService
+
+logger = logging.getLogger(__name__)
+
+
+class AccessLogBuffer:
+    """Queue access logs and flush them every ``batch_size`` rows or ``flush_interval`` seconds"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background flusher; the final drain also runs at interpreter exit"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="access-log-buffer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the flusher and write whatever is still queued"""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+            atexit.unregister(self.stop)
+        self.flush()
+
+    def put(
+        self,
+        report_id: int,
+        user_id: int,
+        access_type: str,
+        access_status: str = "success",
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        error_message: Optional[str] = None,
+        duration_seconds: Optional[int] = None,
+    ) -> datetime:
+        """Queue one access log; accessed_at is taken now, not at flush time, and returned"""
+        accessed_at = datetime.utcnow()
+        self._queue.put(
+            {
+                "report_id": report_id,
+                "user_id": user_id,
+                "access_type": access_type,
+                "access_status": access_status,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "error_message": error_message,
+                "duration_seconds": duration_seconds,
+                "accessed_at": accessed_at,
+            }
+        )
+        return accessed_at
+
+    def pending(self) -> int:
+        """Approximate number of queued rows"""
+        return self._queue.qsize()
+
+    def flush(self) -> int:
+        """Synchronously write everything queued so far"""
+        written = 0
+        while True:
+            batch = self._take(self.batch_size)
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def _take(self, limit: int) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _collect(self) -> List[Dict[str, Any]]:
+        """Block until a full batch is queued or the flush interval elapses"""
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> int:
+        db = self.session_factory()
+        try:
+            written = ReportAccessService.log_access_bulk(db, batch, batch_size=self.batch_size)
+            db.commit()
+            return written
+        except Exception:
+            db.rollback()
+            logger.exception("Dropped %d buffered access logs", len(batch))
+            return 0
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._collect()
+            if batch:
+                self._write(batch)
@@ -0,0 +1,101 @@
+"""
+Reporting Service - In-Process Caching
+
+Small thread-safe TTL cache for rarely-changing lookups such as templates.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after they are set
+
+    Entries may carry a ``tag`` (e.g. a report id) so one ``pop_tag`` drops them all.
+    Every invalidation bumps ``generation``; a reader that captured it before querying
+    passes it back to ``set`` and the store is skipped if a write landed in between.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any, Hashable]] = {}
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return default
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tag: Optional[Hashable] = None,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """Store ``value``; returns False (and stores nothing) if ``generation`` is stale"""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            now = time.monotonic()
+            if key in self._data:
+                self._drop(key)
+            elif len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + self.ttl, value, tag)
+            if tag is not None:
+                self._tags.setdefault(tag, set()).add(key)
+            return True
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            if key in self._data:
+                self._drop(key)
+
+    def pop_tag(self, tag: Hashable) -> None:
+        """Drop every entry stored with ``tag``"""
+        with self._lock:
+            self._generation += 1
+            for key in self._tags.pop(tag, ()):
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove one entry and its tag link (caller holds the lock)"""
+        _, _, tag = self._data.pop(key)
+        if tag is not None:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the oldest if still full (caller holds the lock)"""
+        for key in [k for k, (expires_at, _, _) in self._data.items() if expires_at <= now]:
+            self._drop(key)
+        if len(self._data) >= self.maxsize:
+            self._drop(next(iter(self._data)))
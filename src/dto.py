@@ -0,0 +1,108 @@
+"""
+Reporting Service DTOs
+
+Lightweight row objects for list endpoints. Listers select only the columns
+below and build these directly from result tuples, skipping ORM hydration
+and the identity map. Field order matches the column tuples.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, Optional
+
+from .models import Report, ReportAccess, ReportMetric
+
+
+REPORT_COLUMNS = (
+    Report.id,
+    Report.user_id,
+    Report.template_id,
+    Report.report_name,
+    Report.report_type,
+    Report.date_range_start,
+    Report.date_range_end,
+    Report.status,
+    Report.progress_percent,
+    Report.total_records,
+    Report.generated_at,
+    Report.file_size,
+    Report.generation_time_seconds,
+    Report.created_at,
+)
+
+REPORT_METRIC_COLUMNS = (
+    ReportMetric.id,
+    ReportMetric.report_id,
+    ReportMetric.metric_name,
+    ReportMetric.metric_value,
+    ReportMetric.metric_unit,
+    ReportMetric.metric_category,
+    ReportMetric.recorded_at,
+)
+
+REPORT_ACCESS_COLUMNS = (
+    ReportAccess.id,
+    ReportAccess.report_id,
+    ReportAccess.user_id,
+    ReportAccess.access_type,
+    ReportAccess.access_status,
+    ReportAccess.access_duration_seconds,
+    ReportAccess.accessed_at,
+)
+
+_REPORT_FIELDS = tuple(column.key for column in REPORT_COLUMNS)
+_REPORT_GETTER = attrgetter(*_REPORT_FIELDS)
+_REPORT_METRIC_FIELDS = tuple(column.key for column in REPORT_METRIC_COLUMNS)
+_REPORT_METRIC_GETTER = attrgetter(*_REPORT_METRIC_FIELDS)
+_REPORT_ACCESS_FIELDS = tuple(column.key for column in REPORT_ACCESS_COLUMNS)
+_REPORT_ACCESS_GETTER = attrgetter(*_REPORT_ACCESS_FIELDS)
+
+
+@dataclass(slots=True)
+class ReportDTO:
+    id: int
+    user_id: int
+    template_id: int
+    report_name: str
+    report_type: str
+    date_range_start: datetime
+    date_range_end: datetime
+    status: str
+    progress_percent: Optional[int]
+    total_records: Optional[int]
+    generated_at: Optional[datetime]
+    file_size: Optional[int]
+    generation_time_seconds: Optional[float]
+    created_at: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_REPORT_FIELDS, _REPORT_GETTER(self)))
+
+
+@dataclass(slots=True)
+class ReportMetricDTO:
+    id: int
+    report_id: int
+    metric_name: str
+    metric_value: float
+    metric_unit: Optional[str]
+    metric_category: Optional[str]
+    recorded_at: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_REPORT_METRIC_FIELDS, _REPORT_METRIC_GETTER(self)))
+
+
+@dataclass(slots=True)
+class ReportAccessDTO:
+    id: int
+    report_id: int
+    user_id: int
+    access_type: str
+    access_status: Optional[str]
+    access_duration_seconds: Optional[int]
+    accessed_at: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_REPORT_ACCESS_FIELDS, _REPORT_ACCESS_GETTER(self)))
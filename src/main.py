@@ -5,36 +5,170 @@ REST API endpoints for report generation, scheduling, export management,
 and performance tracking.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Generator
-
-from fastapi import FastAPI, HTTPException, Depends, Query
-from sqlalchemy import create_engine
+import hashlib
+import logging
+import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import List, Optional, Dict, Any, AsyncIterator, Generator
+
+import anyio
+import orjson
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from .access_log_buffer import AccessLogBuffer
+from .models import Base
+from .reporting_service import (
+    ReportTemplateService,
+    ReportGenerationService,
+    ReportScheduleService,
+    ReportExportService,
+    ReportMetricsService,
+    ReportAccessService,
+)
+from .responses import ORJSONResponse
+from .schemas import (
+    AccessQueued,
+    ExportCreated,
+    ExportDownloaded,
+    MetricRecorded,
+    ReportCreated,
+    ReportOut,
+    ReportStatusUpdated,
+    ScheduleCreated,
+    ScheduleExecuted,
+    TemplateCreated,
+    TemplateOut,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application startup and shutdown"""
+    # DB-bound endpoints are sync and run in anyio's threadpool
+    threadpool_size = os.getenv("THREADPOOL_SIZE")
+    if threadpool_size:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = int(threadpool_size)
+    # Access logs are written in batches off the request path; shutdown drains the queue
+    access_logs = AccessLogBuffer(SessionLocal)
+    access_logs.start()
+    app.state.access_log_buffer = access_logs
+    try:
+        yield
+    finally:
+        await anyio.to_thread.run_sync(access_logs.stop)
+
+
 # Create FastAPI app first
 app = FastAPI(
     title="Reporting Service",
     description="Report generation, scheduling, export, and analytics",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+# List payloads are repetitive JSON; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+
+def _json_column_dumps(value: Any) -> str:
+    """orjson encoder for JSON columns (the DBAPI wants str, orjson returns bytes)"""
+    return orjson.dumps(value).decode()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """WAL lets readers run alongside the single writer; NORMAL sync is safe under WAL"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def _make_engine(url: str) -> Engine:
+    """Create an engine with this service's pool and JSON settings"""
+    if url.startswith("sqlite"):
+        engine_options: Dict[str, Any] = {
+            "connect_args": {"check_same_thread": False, "timeout": 30},
+        }
+    else:
+        # Size the pool to the threadpool so sync endpoints don't queue on connections
+        engine_options = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "25")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "25")),
+            "pool_pre_ping": True,
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        }
+    new_engine = create_engine(
+        url,
+        echo=False,
+        json_serializer=_json_column_dumps,
+        json_deserializer=orjson.loads,
+        **engine_options,
+    )
+    if new_engine.dialect.name == "sqlite":
+        event.listen(new_engine, "connect", _set_sqlite_pragmas)
+    return new_engine
 
-# Import models after app creation
-from .models import Base
 
 # Initialize database
-DATABASE_URL = "sqlite:///./reporting_service.db"
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=False,
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./reporting_service.db")
+engine = _make_engine(DATABASE_URL)
+
+# GET endpoints read through DATABASE_READ_URL (e.g. a replica) when set, else the primary
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+read_engine = _make_engine(DATABASE_READ_URL) if DATABASE_READ_URL else engine
+
+
+# Dev/test aid: count SQL statements per request to spot N+1 patterns in handlers.
+# Lazy loads already raise (relationships are raise_on_sql); this catches the rest.
+_request_queries: ContextVar[Optional[List[int]]] = ContextVar("request_queries", default=None)
+
+if os.getenv("QUERY_COUNT_ENABLED"):
+
+    def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+        counter = _request_queries.get()
+        if counter is not None:
+            counter[0] += 1
+
+    for _engine in {engine, read_engine}:
+        event.listen(_engine, "before_cursor_execute", _count_query)
+
+    @app.middleware("http")
+    async def _report_query_count(request: Request, call_next):
+        counter = [0]
+        token = _request_queries.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _request_queries.reset(token)
+        response.headers["X-Query-Count"] = str(counter[0])
+        logger.info("%s %s ran %d queries", request.method, request.url.path, counter[0])
+        return response
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+# Replica sessions are flagged so the services never fill their caches from a lagging read
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=read_engine,
+    info={"replica": read_engine is not engine},
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base.metadata.create_all(bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Get database session"""
+    """Get database session; write endpoints commit it, close() rolls back anything uncommitted"""
     db = SessionLocal()
     try:
         yield db
@@ -42,14 +176,40 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-from .reporting_service import (
-    ReportTemplateService,
-    ReportGenerationService,
-    ReportScheduleService,
-    ReportExportService,
-    ReportMetricsService,
-    ReportAccessService,
-)
+def get_read_db() -> Generator[Session, None, None]:
+    """Get a session for read-only endpoints (replica when DATABASE_READ_URL is set)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == tag for t in header.split(","))
+
+
+def _keyset_cursor(after_created_at: Optional[datetime], after_id: Optional[int]) -> Optional[tuple]:
+    """(created_at, id) keyset cursor from query params; both or neither must be given"""
+    if after_created_at is None and after_id is None:
+        return None
+    if after_created_at is None or after_id is None:
+        raise HTTPException(status_code=400, detail="after_created_at and after_id must be given together")
+    return after_created_at, after_id
+
+
+def _next_cursor(rows: List[Any], limit: int) -> Optional[Dict[str, Any]]:
+    """Cursor for the page after a full one, None once the listing is exhausted"""
+    if len(rows) < limit:
+        return None
+    return {"after_created_at": rows[-1].created_at, "after_id": rows[-1].id}
 
 
 # ============================================================================
@@ -57,8 +217,8 @@ from .reporting_service import (
 # ============================================================================
 
 
-@app.post("/templates", status_code=201)
-async def create_report_template(
+@app.post("/templates", status_code=201, response_model=TemplateCreated)
+def create_report_template(
     template_name: str,
     template_type: str,
     description: Optional[str] = None,
@@ -78,58 +238,65 @@ async def create_report_template(
             export_formats=export_formats,
             is_default=is_default,
         )
-        return {
-            "id": template.id,
-            "template_name": template.template_name,
-            "template_type": template.template_type,
-            "created_at": template.created_at,
-        }
+        db.commit()
+        return template
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.get("/templates/{template_id}")
-async def get_report_template(template_id: int, db: Session = Depends(get_db)):
+@app.get("/templates/{template_id}", response_model=TemplateOut)
+def get_report_template(template_id: int, request: Request, db: Session = Depends(get_read_db)):
     """Get template by ID"""
     template = ReportTemplateService.get_template(db, template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
-    return template.to_dict()
+    # updated_at moves on every write, so it versions the representation
+    headers = {
+        "ETag": f'W/"{template.id}-{template.updated_at.timestamp()}"',
+        "Cache-Control": "public, max-age=60",
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(template.to_dict(), headers=headers)
 
 
 @app.get("/templates/type/{template_type}")
-async def get_templates_by_type(
+def get_templates_by_type(
     template_type: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get templates by type"""
     templates, total = ReportTemplateService.get_templates_by_type(
         db, template_type, limit, offset
     )
-    return {
-        "templates": [t.to_dict() for t in templates],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "templates": [t.to_dict() for t in templates],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @app.get("/templates")
-async def list_templates(
+def list_templates(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """List all active templates"""
     templates, total = ReportTemplateService.list_active_templates(db, limit, offset)
-    return {
-        "templates": [t.to_dict() for t in templates],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "templates": [t.to_dict() for t in templates],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 # ============================================================================
@@ -137,8 +304,8 @@ async def list_templates(
 # ============================================================================
 
 
-@app.post("/reports", status_code=201)
-async def create_report(
+@app.post("/reports", status_code=201, response_model=ReportCreated)
+def create_report(
     user_id: int,
     template_id: int,
     report_name: str,
@@ -165,65 +332,64 @@ async def create_report(
             date_range_end=date_range_end,
             filters=filters,
         )
-        return {
-            "id": report.id,
-            "report_name": report.report_name,
-            "status": report.status,
-            "created_at": report.created_at,
-        }
+        db.commit()
+        return report
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.get("/reports/{report_id}")
-async def get_report(
+@app.get("/reports/{report_id}", response_model=ReportOut)
+def get_report(
     report_id: int,
     user_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get report by ID"""
     report = ReportGenerationService.get_report(db, report_id, user_id)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
-    return report.to_dict()
+    return ORJSONResponse(report.to_dict())
 
 
 @app.get("/reports/user/{user_id}")
-async def get_user_reports(
+def get_user_reports(
     user_id: int,
     status: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_read_db),
 ):
-    """Get user reports"""
+    """Get user reports (pass next_after back as after_created_at/after_id for the next page)"""
     reports, total = ReportGenerationService.get_user_reports(
-        db, user_id, status, limit, offset
+        db, user_id, status, limit, offset, after=_keyset_cursor(after_created_at, after_id)
+    )
+    return ORJSONResponse(
+        {
+            "reports": [r.to_dict() for r in reports],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_after": _next_cursor(reports, limit),
+        }
     )
-    return {
-        "reports": [r.to_dict() for r in reports],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
 
 
-@app.patch("/reports/{report_id}/status")
-async def update_report_status(
+@app.patch("/reports/{report_id}/status", response_model=ReportStatusUpdated)
+def update_report_status(
     report_id: int,
     status: str,
     progress_percent: int = 0,
     db: Session = Depends(get_db),
 ):
     """Update report status"""
-    report = ReportGenerationService.update_report_status(
-        db, report_id, status, progress_percent
-    )
-    if not report:
+    if not ReportGenerationService.update_report_status(db, report_id, status, progress_percent):
         raise HTTPException(status_code=404, detail="Report not found")
-    return {"status": report.status, "progress": report.progress_percent}
+    db.commit()
+    return {"status": status, "progress": progress_percent}
 
 
 # ============================================================================
@@ -231,8 +397,8 @@ async def update_report_status(
 # ============================================================================
 
 
-@app.post("/schedules", status_code=201)
-async def create_schedule(
+@app.post("/schedules", status_code=201, response_model=ScheduleCreated)
+def create_schedule(
     user_id: int,
     template_id: int,
     schedule_name: str,
@@ -261,13 +427,8 @@ async def create_schedule(
             recipients=recipients,
             delivery_method=delivery_method,
         )
-        return {
-            "id": schedule.id,
-            "schedule_name": schedule.schedule_name,
-            "frequency": schedule.frequency,
-            "next_run_at": schedule.next_run_at,
-            "created_at": schedule.created_at,
-        }
+        db.commit()
+        return schedule
     except HTTPException:
         raise
     except Exception as e:
@@ -275,36 +436,43 @@ async def create_schedule(
 
 
 @app.get("/schedules/due")
-async def get_due_schedules(db: Session = Depends(get_db)):
-    """Get schedules due for execution"""
+def get_due_schedules(db: Session = Depends(get_db)):
+    """Get schedules due for execution (from the primary: replica lag would re-run schedules)"""
     schedules = ReportScheduleService.get_schedules_due_for_execution(db)
-    return {
-        "schedules": [s.to_dict() for s in schedules],
-        "count": len(schedules),
-    }
+    return ORJSONResponse(
+        {
+            "schedules": [s.to_dict() for s in schedules],
+            "count": len(schedules),
+        }
+    )
 
 
 @app.get("/schedules/user/{user_id}")
-async def get_user_schedules(
+def get_user_schedules(
     user_id: int,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_read_db),
 ):
-    """Get schedules for a user"""
+    """Get schedules for a user (keyset cursor as for reports)"""
     schedules, total = ReportScheduleService.get_user_schedules(
-        db, user_id, limit, offset
+        db, user_id, limit, offset, after=_keyset_cursor(after_created_at, after_id)
+    )
+    return ORJSONResponse(
+        {
+            "schedules": [s.to_dict() for s in schedules],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_after": _next_cursor(schedules, limit),
+        }
     )
-    return {
-        "schedules": [s.to_dict() for s in schedules],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
 
 
-@app.patch("/schedules/{schedule_id}/execute")
-async def mark_schedule_executed(
+@app.patch("/schedules/{schedule_id}/execute", response_model=ScheduleExecuted)
+def mark_schedule_executed(
     schedule_id: int,
     success: bool = True,
     db: Session = Depends(get_db),
@@ -313,10 +481,8 @@ async def mark_schedule_executed(
     schedule = ReportScheduleService.update_schedule_after_execution(db, schedule_id, success)
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    return {
-        "next_run_at": schedule.next_run_at,
-        "run_count": schedule.run_count,
-    }
+    db.commit()
+    return schedule
 
 
 # ============================================================================
@@ -324,8 +490,8 @@ async def mark_schedule_executed(
 # ============================================================================
 
 
-@app.post("/exports", status_code=201)
-async def create_export(
+@app.post("/exports", status_code=201, response_model=ExportCreated)
+def create_export(
     report_id: int,
     export_format: str,
     file_path: str,
@@ -346,12 +512,8 @@ async def create_export(
             file_path=file_path,
             file_size=file_size,
         )
-        return {
-            "id": export.id,
-            "export_format": export.export_format,
-            "export_status": export.export_status,
-            "created_at": export.created_at,
-        }
+        db.commit()
+        return export
     except HTTPException:
         raise
     except Exception as e:
@@ -359,32 +521,32 @@ async def create_export(
 
 
 @app.get("/exports/report/{report_id}")
-async def get_report_exports(
+def get_report_exports(
     report_id: int,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get exports for a report"""
     exports, total = ReportExportService.get_report_exports(db, report_id, limit, offset)
-    return {
-        "exports": [e.to_dict() for e in exports],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "exports": [e.to_dict() for e in exports],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
-@app.patch("/exports/{export_id}/download")
-async def record_export_download(export_id: int, db: Session = Depends(get_db)):
+@app.patch("/exports/{export_id}/download", response_model=ExportDownloaded)
+def record_export_download(export_id: int, db: Session = Depends(get_db)):
     """Record an export download"""
     export = ReportExportService.record_download(db, export_id)
     if not export:
         raise HTTPException(status_code=404, detail="Export not found")
-    return {
-        "download_count": export.download_count,
-        "last_downloaded_at": export.last_downloaded_at,
-    }
+    db.commit()
+    return export
 
 
 # ============================================================================
@@ -392,8 +554,8 @@ async def record_export_download(export_id: int, db: Session = Depends(get_db)):
 # ============================================================================
 
 
-@app.post("/metrics", status_code=201)
-async def record_metric(
+@app.post("/metrics", status_code=201, response_model=MetricRecorded)
+def record_metric(
     report_id: int,
     metric_name: str,
     metric_value: float,
@@ -411,57 +573,57 @@ async def record_metric(
             metric_unit=metric_unit,
             metric_category=metric_category,
         )
-        return {
-            "id": metric.id,
-            "metric_name": metric.metric_name,
-            "metric_value": metric.metric_value,
-            "recorded_at": metric.recorded_at,
-        }
+        db.commit()
+        return metric
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/metrics/report/{report_id}")
-async def get_report_metrics(
+def get_report_metrics(
     report_id: int,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get metrics for a report"""
     metrics, total = ReportMetricsService.get_report_metrics(db, report_id, limit, offset)
-    return {
-        "metrics": [m.to_dict() for m in metrics],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "metrics": [m.to_dict() for m in metrics],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @app.get("/metrics/category/{category}")
-async def get_metrics_by_category(
+def get_metrics_by_category(
     category: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get metrics by category"""
     metrics, total = ReportMetricsService.get_metrics_by_category(
         db, category, limit, offset
     )
-    return {
-        "metrics": [m.to_dict() for m in metrics],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "metrics": [m.to_dict() for m in metrics],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @app.get("/metrics/average/{metric_name}")
-async def get_average_metrics(
+def get_average_metrics(
     metric_name: str,
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get average metrics over time period"""
     stats = ReportMetricsService.get_average_metrics(db, metric_name, days)
@@ -477,8 +639,9 @@ async def get_average_metrics(
 # ============================================================================
 
 
-@app.post("/access-logs", status_code=201)
-async def log_report_access(
+@app.post("/access-logs", status_code=202, response_model=AccessQueued)
+def log_report_access(
+    request: Request,
     report_id: int,
     user_id: int,
     access_type: str,
@@ -487,67 +650,67 @@ async def log_report_access(
     user_agent: Optional[str] = None,
     error_message: Optional[str] = None,
     duration_seconds: Optional[int] = None,
-    db: Session = Depends(get_db),
 ):
-    """Log report access"""
-    try:
-        log = ReportAccessService.log_access(
-            db=db,
-            report_id=report_id,
-            user_id=user_id,
-            access_type=access_type,
-            access_status=access_status,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            error_message=error_message,
-            duration_seconds=duration_seconds,
-        )
-        return {
-            "id": log.id,
-            "access_type": log.access_type,
-            "access_status": log.access_status,
-            "accessed_at": log.accessed_at,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    """Queue a report access log; the background buffer writes it within a second"""
+    accessed_at = request.app.state.access_log_buffer.put(
+        report_id=report_id,
+        user_id=user_id,
+        access_type=access_type,
+        access_status=access_status,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        error_message=error_message,
+        duration_seconds=duration_seconds,
+    )
+    return {
+        "report_id": report_id,
+        "user_id": user_id,
+        "access_type": access_type,
+        "access_status": access_status,
+        "accessed_at": accessed_at,
+    }
 
 
 @app.get("/access-logs/report/{report_id}")
-async def get_report_access_logs(
+def get_report_access_logs(
     report_id: int,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get access logs for a report"""
     logs, total = ReportAccessService.get_report_access_logs(db, report_id, limit, offset)
-    return {
-        "logs": [l.to_dict() for l in logs],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "logs": [l.to_dict() for l in logs],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @app.get("/access-logs/user/{user_id}")
-async def get_user_access_logs(
+def get_user_access_logs(
     user_id: int,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get access logs for a user"""
     logs, total = ReportAccessService.get_user_access_logs(db, user_id, limit, offset)
-    return {
-        "logs": [l.to_dict() for l in logs],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return ORJSONResponse(
+        {
+            "logs": [l.to_dict() for l in logs],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
 
 
 @app.get("/access-logs/report/{report_id}/stats")
-async def get_access_statistics(report_id: int, db: Session = Depends(get_db)):
+def get_access_statistics(report_id: int, db: Session = Depends(get_read_db)):
     """Get access statistics for a report"""
     stats = ReportAccessService.get_access_statistics(db, report_id)
     return stats
@@ -561,18 +724,20 @@ async def get_access_statistics(report_id: int, db: Session = Depends(get_db)):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "reporting-service",
-        "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "service": "reporting-service",
+            "version": "1.0.0",
+            "timestamp": datetime.utcnow(),
+        },
+        headers={"Cache-Control": "no-store"},
+    )
 
 
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
+# The service index never changes, so it is serialized once at import
+_ROOT_JSON: bytes = orjson.dumps(
+    {
         "service": "Reporting Service",
         "version": "1.0.0",
         "endpoints": {
@@ -585,6 +750,19 @@ async def root():
             "health": "/health",
         },
     }
+)
+_ROOT_HEADERS: Dict[str, str] = {
+    "ETag": f'"{hashlib.sha256(_ROOT_JSON).hexdigest()}"',
+    "Cache-Control": "public, max-age=3600",
+}
+
+
+@app.get("/")
+async def root(request: Request):
+    """Root endpoint"""
+    if _etag_matches(request, _ROOT_HEADERS["ETag"]):
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(_ROOT_JSON, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 if __name__ == "__main__":
@@ -6,24 +6,175 @@ and performance tracking. Features soft delete pattern and strategic database in
 """
 
 from datetime import datetime
-from decimal import Decimal
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy import (
-    VARCHAR,
-    Column,
+    Boolean,
     DateTime,
     Float,
     ForeignKey,
     Index,
     Integer,
+    JSON,
+    LargeBinary,
     Numeric,
     String,
     Text,
+    false,
+    literal_column,
+    true,
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql.expression import FunctionElement
 
-Base = declarative_base()
+
+class utcnow(FunctionElement):
+    """Database-side naive UTC timestamp, matching the datetime.utcnow() values stored elsewhere"""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw) -> str:
+    # Same 6-digit text SQLAlchemy binds for datetimes; %f alone gives milliseconds, which
+    # compares as earlier than the equal bound value ("...04.398" < "...04.398000")
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw) -> str:
+    return "(UTC_TIMESTAMP(6))"
+
+
+class Base(DeclarativeBase):
+    # Fetch server-generated timestamps in the INSERT/UPDATE via RETURNING where supported
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Native JSON (JSONB on PostgreSQL); None is stored as SQL NULL, not JSON null
+JSONColumn = JSON(none_as_null=True).with_variant(postgresql.JSONB(none_as_null=True), "postgresql")
+
+
+def _live_index(name: str, *columns: str, include: Sequence[str] = ()) -> Index:
+    """Partial index over rows that are not soft-deleted (MySQL ignores the predicate)
+
+    ``include`` adds PostgreSQL INCLUDE payload columns for index-only scans.
+    """
+    live = literal_column("is_deleted", Boolean) == false()
+    return Index(
+        name,
+        *columns,
+        postgresql_where=live,
+        postgresql_include=list(include),
+        sqlite_where=live,
+    )
+
+
+def _brin_index(name: str, column: str) -> Index:
+    """BRIN index for append-ordered timestamps; PostgreSQL only, other dialects skip it"""
+    return Index(
+        name,
+        column,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    ).ddl_if(dialect="postgresql")
+
+
+# to_dict field order; attrgetter fetches them in one C call per row
+_REPORT_TEMPLATE_FIELDS = (
+    "id",
+    "template_name",
+    "template_type",
+    "description",
+    "is_default",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+_REPORT_TEMPLATE_GETTER = attrgetter(*_REPORT_TEMPLATE_FIELDS)
+
+_REPORT_FIELDS = (
+    "id",
+    "user_id",
+    "template_id",
+    "report_name",
+    "report_type",
+    "date_range_start",
+    "date_range_end",
+    "status",
+    "progress_percent",
+    "total_records",
+    "generated_at",
+    "file_size",
+    "generation_time_seconds",
+    "created_at",
+)
+_REPORT_GETTER = attrgetter(*_REPORT_FIELDS)
+
+_REPORT_SCHEDULE_FIELDS = (
+    "id",
+    "user_id",
+    "template_id",
+    "schedule_name",
+    "frequency",
+    "is_enabled",
+    "next_run_at",
+    "last_run_at",
+    "run_count",
+    "success_count",
+    "failure_count",
+    "created_at",
+)
+_REPORT_SCHEDULE_GETTER = attrgetter(*_REPORT_SCHEDULE_FIELDS)
+
+_REPORT_EXPORT_FIELDS = (
+    "id",
+    "report_id",
+    "export_format",
+    "file_size",
+    "export_status",
+    "exported_at",
+    "download_count",
+    "last_downloaded_at",
+    "created_at",
+)
+_REPORT_EXPORT_GETTER = attrgetter(*_REPORT_EXPORT_FIELDS)
+
+_REPORT_METRIC_FIELDS = (
+    "id",
+    "report_id",
+    "metric_name",
+    "metric_value",
+    "metric_unit",
+    "metric_category",
+    "recorded_at",
+)
+_REPORT_METRIC_GETTER = attrgetter(*_REPORT_METRIC_FIELDS)
+
+_REPORT_ACCESS_FIELDS = (
+    "id",
+    "report_id",
+    "user_id",
+    "access_type",
+    "access_status",
+    "access_duration_seconds",
+    "accessed_at",
+)
+_REPORT_ACCESS_GETTER = attrgetter(*_REPORT_ACCESS_FIELDS)
 
 
 class ReportTemplate(Base):
@@ -34,35 +185,26 @@ class ReportTemplate(Base):
 
     __tablename__ = "report_templates"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    template_name = Column(String(100), nullable=False, unique=True)
-    template_type = Column(String(50), nullable=False)  # sales, analytics, financial, custom
-    description = Column(Text)
-    sections = Column(Text)  # JSON array of sections: summary, charts, tables, metrics
-    export_formats = Column(Text)  # JSON array: pdf, csv, xlsx, json, html
-    is_default = Column(Integer, default=0)
-    is_active = Column(Integer, default=1)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    is_deleted = Column(Integer, default=0)
-    deleted_at = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    template_name: Mapped[str] = mapped_column(String(100), unique=True)
+    template_type: Mapped[str] = mapped_column(String(50))  # sales, analytics, financial, custom
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    sections: Mapped[Optional[List[str]]] = mapped_column(JSONColumn)  # array of sections: summary, charts, tables, metrics
+    export_formats: Mapped[Optional[List[str]]] = mapped_column(JSONColumn)  # pdf, csv, xlsx, json, html
+    is_default: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true())
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     __table_args__ = (
-        Index("idx_report_templates_type_active", "template_type", "is_active"),
+        _live_index("idx_report_templates_type_active", "template_type", "is_active"),
         Index("idx_report_templates_name", "template_name"),
     )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "template_name": self.template_name,
-            "template_type": self.template_type,
-            "description": self.description,
-            "is_default": bool(self.is_default),
-            "is_active": bool(self.is_active),
-            "created_at": self.created_at.isoformat() if self.created_at is not None else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at is not None else None,
-        }
+        return dict(zip(_REPORT_TEMPLATE_FIELDS, _REPORT_TEMPLATE_GETTER(self)))
 
 
 class Report(Base):
@@ -73,53 +215,48 @@ class Report(Base):
 
     __tablename__ = "reports"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, nullable=False, index=True)
-    template_id = Column(Integer, ForeignKey("report_templates.id"), nullable=False)
-    report_name = Column(String(255), nullable=False)
-    report_type = Column(String(50), nullable=False)
-    date_range_start = Column(DateTime, nullable=False)
-    date_range_end = Column(DateTime, nullable=False)
-    status = Column(String(50), nullable=False)  # draft, generating, ready, failed, archived
-    progress_percent = Column(Integer, default=0)
-    total_records = Column(Integer, default=0)
-    rows_generated = Column(Integer, default=0)
-    generated_at = Column(DateTime)
-    generated_by = Column(String(50))  # system, manual, scheduled
-    file_path = Column(String(500))
-    file_size = Column(Integer)
-    export_formats = Column(Text)  # JSON array of formats available
-    filters = Column(Text)  # JSON filters applied
-    error_message = Column(Text)
-    generation_time_seconds = Column(Float)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    is_deleted = Column(Integer, default=0)
-    deleted_at = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, index=True)
+    template_id: Mapped[int] = mapped_column(Integer, ForeignKey("report_templates.id"))
+    report_name: Mapped[str] = mapped_column(String(255))
+    report_type: Mapped[str] = mapped_column(String(50))
+    date_range_start: Mapped[datetime] = mapped_column(DateTime)
+    date_range_end: Mapped[datetime] = mapped_column(DateTime)
+    status: Mapped[str] = mapped_column(String(50))  # draft, generating, ready, failed, archived
+    progress_percent: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    total_records: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    rows_generated: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    generated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    generated_by: Mapped[Optional[str]] = mapped_column(String(50))  # system, manual, scheduled
+    file_path: Mapped[Optional[str]] = mapped_column(String(500))
+    file_size: Mapped[Optional[int]] = mapped_column(Integer)
+    export_formats: Mapped[Optional[List[str]]] = mapped_column(JSONColumn)  # formats available
+    filters: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONColumn)  # filters applied
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    generation_time_seconds: Mapped[Optional[float]] = mapped_column(Float)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    # Never lazy-loads, so an N+1 fails loudly; queries opt in with selectinload()
+    template: Mapped["ReportTemplate"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (
-        Index("idx_reports_user_status", "user_id", "status"),
-        Index("idx_reports_type_created", "report_type", "created_at"),
-        Index("idx_reports_generated_status", "status", "generated_at"),
+        _live_index(
+            "idx_reports_user_status",
+            "user_id",
+            "status",
+            "created_at",
+            include=("report_name", "generated_at", "file_size"),
+        ),
+        _live_index("idx_reports_user_created", "user_id", "created_at", "id"),
+        _live_index("idx_reports_type_created", "report_type", "created_at"),
+        _live_index("idx_reports_generated_status", "status", "generated_at"),
     )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "template_id": self.template_id,
-            "report_name": self.report_name,
-            "report_type": self.report_type,
-            "date_range_start": self.date_range_start.isoformat() if self.date_range_start is not None else None,
-            "date_range_end": self.date_range_end.isoformat() if self.date_range_end is not None else None,
-            "status": self.status,
-            "progress_percent": self.progress_percent,
-            "total_records": self.total_records,
-            "generated_at": self.generated_at.isoformat() if self.generated_at is not None else None,
-            "file_size": self.file_size,
-            "generation_time_seconds": self.generation_time_seconds,
-            "created_at": self.created_at.isoformat() if self.created_at is not None else None,
-        }
+        return dict(zip(_REPORT_FIELDS, _REPORT_GETTER(self)))
 
 
 class ReportSchedule(Base):
@@ -130,50 +267,45 @@ class ReportSchedule(Base):
 
     __tablename__ = "report_schedules"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, nullable=False, index=True)
-    template_id = Column(Integer, ForeignKey("report_templates.id"), nullable=False)
-    schedule_name = Column(String(255), nullable=False)
-    frequency = Column(String(50), nullable=False)  # daily, weekly, monthly, quarterly, yearly
-    day_of_week = Column(Integer)  # 0-6 for weekly (0=Monday)
-    day_of_month = Column(Integer)  # 1-31 for monthly
-    time_of_day = Column(String(5))  # HH:MM format
-    timezone = Column(String(50), default="UTC")
-    is_enabled = Column(Integer, default=1)
-    next_run_at = Column(DateTime)
-    last_run_at = Column(DateTime)
-    run_count = Column(Integer, default=0)
-    success_count = Column(Integer, default=0)
-    failure_count = Column(Integer, default=0)
-    recipients = Column(Text)  # JSON array of email addresses
-    delivery_method = Column(String(50))  # email, download, webhook
-    webhook_url = Column(String(500))
-    include_file = Column(Integer, default=1)  # Whether to include report file
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    is_deleted = Column(Integer, default=0)
-    deleted_at = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, index=True)
+    template_id: Mapped[int] = mapped_column(Integer, ForeignKey("report_templates.id"))
+    schedule_name: Mapped[str] = mapped_column(String(255))
+    frequency: Mapped[str] = mapped_column(String(50))  # daily, weekly, monthly, quarterly, yearly
+    day_of_week: Mapped[Optional[int]] = mapped_column(Integer)  # 0-6 for weekly (0=Monday)
+    day_of_month: Mapped[Optional[int]] = mapped_column(Integer)  # 1-31 for monthly
+    time_of_day: Mapped[Optional[str]] = mapped_column(String(5))  # HH:MM format
+    timezone: Mapped[Optional[str]] = mapped_column(String(50), default="UTC")
+    is_enabled: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true())
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    run_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    success_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    failure_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    recipients: Mapped[Optional[List[str]]] = mapped_column(JSONColumn)  # email addresses
+    delivery_method: Mapped[Optional[str]] = mapped_column(String(50))  # email, download, webhook
+    webhook_url: Mapped[Optional[str]] = mapped_column(String(500))
+    include_file: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true())  # Whether to include report file
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    template: Mapped["ReportTemplate"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (
-        Index("idx_report_schedules_user_enabled", "user_id", "is_enabled"),
-        Index("idx_report_schedules_next_run", "next_run_at", "is_enabled"),
+        _live_index(
+            "idx_report_schedules_user_enabled",
+            "user_id",
+            "is_enabled",
+            include=("schedule_name", "next_run_at"),
+        ),
+        _live_index("idx_report_schedules_user_created", "user_id", "created_at", "id"),
+        _live_index("idx_report_schedules_due", "is_enabled", "next_run_at"),
     )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "template_id": self.template_id,
-            "schedule_name": self.schedule_name,
-            "frequency": self.frequency,
-            "is_enabled": bool(self.is_enabled),
-            "next_run_at": self.next_run_at.isoformat() if self.next_run_at is not None else None,
-            "last_run_at": self.last_run_at.isoformat() if self.last_run_at is not None else None,
-            "run_count": self.run_count,
-            "success_count": self.success_count,
-            "failure_count": self.failure_count,
-            "created_at": self.created_at.isoformat() if self.created_at is not None else None,
-        }
+        return dict(zip(_REPORT_SCHEDULE_FIELDS, _REPORT_SCHEDULE_GETTER(self)))
 
 
 class ReportExport(Base):
@@ -184,40 +316,35 @@ class ReportExport(Base):
 
     __tablename__ = "report_exports"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    report_id = Column(Integer, ForeignKey("reports.id"), nullable=False, index=True)
-    export_format = Column(String(20), nullable=False)  # pdf, csv, xlsx, json, html
-    file_path = Column(String(500), nullable=False)
-    file_size = Column(Integer)
-    file_hash = Column(String(100))  # SHA-256 for integrity
-    export_status = Column(String(50), nullable=False)  # pending, processing, completed, failed
-    exported_at = Column(DateTime)
-    download_count = Column(Integer, default=0)
-    last_downloaded_at = Column(DateTime)
-    compression_type = Column(String(20))  # none, gzip, zip
-    error_message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    is_deleted = Column(Integer, default=0)
-    deleted_at = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    report_id: Mapped[int] = mapped_column(Integer, ForeignKey("reports.id"), index=True)
+    export_format: Mapped[str] = mapped_column(String(20))  # pdf, csv, xlsx, json, html
+    file_path: Mapped[str] = mapped_column(String(500))
+    file_size: Mapped[Optional[int]] = mapped_column(Integer)
+    file_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(32).with_variant(mysql.BINARY(32), "mysql")
+    )  # raw SHA-256 digest for integrity
+    export_status: Mapped[str] = mapped_column(String(50))  # pending, processing, completed, failed
+    exported_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    download_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    last_downloaded_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    compression_type: Mapped[Optional[str]] = mapped_column(String(20))  # none, gzip, zip
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    report: Mapped["Report"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (
-        Index("idx_report_exports_report_format", "report_id", "export_format"),
-        Index("idx_report_exports_status", "export_status", "created_at"),
+        _live_index("idx_report_exports_report_format", "report_id", "export_format"),
+        _live_index("idx_report_exports_status", "export_status", "created_at"),
+        _brin_index("idx_report_exports_created_brin", "created_at"),
     )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "report_id": self.report_id,
-            "export_format": self.export_format,
-            "file_size": self.file_size,
-            "export_status": self.export_status,
-            "exported_at": self.exported_at.isoformat() if self.exported_at is not None else None,
-            "download_count": self.download_count,
-            "last_downloaded_at": self.last_downloaded_at.isoformat() if self.last_downloaded_at is not None else None,
-            "created_at": self.created_at.isoformat() if self.created_at is not None else None,
-        }
+        return dict(zip(_REPORT_EXPORT_FIELDS, _REPORT_EXPORT_GETTER(self)))
 
 
 class ReportMetric(Base):
@@ -228,32 +355,28 @@ class ReportMetric(Base):
 
     __tablename__ = "report_metrics"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    report_id = Column(Integer, ForeignKey("reports.id"), nullable=False, index=True)
-    metric_name = Column(String(100), nullable=False)  # generation_time, page_count, data_points, etc.
-    metric_value = Column(Numeric(12, 2), nullable=False)
-    metric_unit = Column(String(50))  # seconds, pages, items, bytes, etc.
-    metric_category = Column(String(50))  # performance, usage, quality
-    recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    is_deleted = Column(Integer, default=0)
-    deleted_at = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    report_id: Mapped[int] = mapped_column(Integer, ForeignKey("reports.id"), index=True)
+    metric_name: Mapped[str] = mapped_column(String(100))  # generation_time, page_count, data_points, etc.
+    metric_value: Mapped[float] = mapped_column(Numeric(12, 2, asdecimal=False))  # returned as float
+    metric_unit: Mapped[Optional[str]] = mapped_column(String(50))  # seconds, pages, items, bytes, etc.
+    metric_category: Mapped[Optional[str]] = mapped_column(String(50))  # performance, usage, quality
+    recorded_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    report: Mapped["Report"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (
-        Index("idx_report_metrics_report_name", "report_id", "metric_name"),
-        Index("idx_report_metrics_category", "metric_category", "recorded_at"),
+        _live_index("idx_report_metrics_report_name", "report_id", "metric_name"),
+        _live_index("idx_report_metrics_category", "metric_category", "recorded_at"),
+        # metric_value rides along so get_average_metrics never touches the table
+        _live_index("idx_report_metrics_name_recorded", "metric_name", "recorded_at", "metric_value"),
+        _brin_index("idx_report_metrics_recorded_brin", "recorded_at"),
     )
 
     def to_dict(self):
-        metric_value = float(self.metric_value) if self.metric_value is not None else 0.0  # type: ignore[reportArgumentType]
-        return {
-            "id": self.id,
-            "report_id": self.report_id,
-            "metric_name": self.metric_name,
-            "metric_value": metric_value,
-            "metric_unit": self.metric_unit,
-            "metric_category": self.metric_category,
-            "recorded_at": self.recorded_at.isoformat() if self.recorded_at is not None else None,
-        }
+        return dict(zip(_REPORT_METRIC_FIELDS, _REPORT_METRIC_GETTER(self)))
 
 
 class ReportAccess(Base):
@@ -264,31 +387,39 @@ class ReportAccess(Base):
 
     __tablename__ = "report_access_logs"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    report_id = Column(Integer, ForeignKey("reports.id"), nullable=False, index=True)
-    user_id = Column(Integer, nullable=False)
-    access_type = Column(String(50), nullable=False)  # view, download, share, print
-    ip_address = Column(String(45))
-    user_agent = Column(String(500))
-    access_status = Column(String(50))  # success, denied, error
-    error_message = Column(Text)
-    access_duration_seconds = Column(Integer)
-    accessed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    is_deleted = Column(Integer, default=0)
-    deleted_at = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    report_id: Mapped[int] = mapped_column(Integer, ForeignKey("reports.id"))
+    user_id: Mapped[int] = mapped_column(Integer)
+    access_type: Mapped[str] = mapped_column(String(50))  # view, download, share, print
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))
+    user_agent: Mapped[Optional[str]] = mapped_column(String(500))
+    access_status: Mapped[Optional[str]] = mapped_column(String(50))  # success, denied, error
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    access_duration_seconds: Mapped[Optional[int]] = mapped_column(Integer)
+    accessed_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    report: Mapped["Report"] = relationship(lazy="raise_on_sql")
 
     __table_args__ = (
-        Index("idx_report_access_report_user", "report_id", "user_id"),
-        Index("idx_report_access_type_date", "access_type", "accessed_at"),
+        _live_index("idx_report_access_report_user", "report_id", "user_id"),
+        # Newest-first log pages per report / per user, read in index order without a sort
+        _live_index(
+            "idx_report_access_report_accessed",
+            "report_id",
+            "accessed_at",
+            include=("id", "user_id", "access_type", "access_status", "access_duration_seconds"),
+        ),
+        _live_index(
+            "idx_report_access_user_accessed",
+            "user_id",
+            "accessed_at",
+            include=("id", "report_id", "access_type", "access_status", "access_duration_seconds"),
+        ),
+        _live_index("idx_report_access_type_date", "access_type", "accessed_at"),
+        _brin_index("idx_report_access_accessed_brin", "accessed_at"),
     )
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "report_id": self.report_id,
-            "user_id": self.user_id,
-            "access_type": self.access_type,
-            "access_status": self.access_status,
-            "access_duration_seconds": self.access_duration_seconds,
-            "accessed_at": self.accessed_at.isoformat() if self.accessed_at is not None else None,
-        }
+        return dict(zip(_REPORT_ACCESS_FIELDS, _REPORT_ACCESS_GETTER(self)))
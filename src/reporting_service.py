@@ -3,15 +3,21 @@ Reporting Service - Business Logic Layer
 
 Comprehensive report management including template handling, scheduling,
 export coordination, and performance tracking.
+
+Service writes only flush; the caller owns the transaction and commits (or rolls
+back) once per request, so chained writes share a single COMMIT.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Tuple
-import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
+from functools import lru_cache
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from sqlalchemy.orm import Session, aliased, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy import DateTime, Integer, bindparam, event, case, distinct, exists, false, func, insert, inspect, select, true, tuple_, update
 
 from .models import (
     ReportTemplate,
@@ -20,11 +26,260 @@ from .models import (
     ReportExport,
     ReportMetric,
     ReportAccess,
-    Base,
+)
+from .cache import TTLCache
+from .dto import (
+    REPORT_COLUMNS,
+    REPORT_METRIC_COLUMNS,
+    REPORT_ACCESS_COLUMNS,
+    ReportDTO,
+    ReportMetricDTO,
+    ReportAccessDTO,
 )
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany() in the bulk write paths
+BULK_BATCH_SIZE = 1000
+
+
+# The per-user report lookup is built once at import; each call only binds the ids
+_REPORT_BY_ID_FOR_USER = select(Report).where(
+    Report.id == bindparam("id"), Report.user_id == bindparam("user_id"), Report.is_deleted == false()
+)
+
+
+def _get_live(db: Session, model: Any, pk: int) -> Any:
+    """Primary-key lookup via Session.get (identity map first), ignoring soft-deleted rows"""
+    obj = db.get(model, pk)
+    return None if obj is None or obj.is_deleted else obj
+
+
+# Templates change rarely and are read on every report/schedule creation
+_template_cache = TTLCache(maxsize=1024, ttl=60)
+_active_templates_cache = TTLCache(maxsize=64, ttl=60)
+# Per-report access statistics, dropped whenever that report gets a new access log
+_access_stats_cache = TTLCache(maxsize=1024, ttl=60)
+# List pages keyed (report_id, limit, offset) and tagged with report_id, so any write to
+# a report's rows drops all of its pages
+_report_metrics_cache = TTLCache(maxsize=1024, ttl=60)
+_report_exports_cache = TTLCache(maxsize=1024, ttl=60)
+
+
+def _invalidate(db: Session, drop: Callable[..., None], *args: Any) -> None:
+    """Drop cache entries now and again once ``db`` commits
+
+    Services only flush; until the caller commits, other sessions still read the old
+    rows and could re-cache them, so the drop is replayed after the commit.
+    """
+    drop(*args)
+    db.info.setdefault("cache_invalidations", []).append((drop, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _replay_cache_invalidations(session: Session) -> None:
+    for drop, args in session.info.pop("cache_invalidations", ()):
+        drop(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_cache_invalidations(session: Session) -> None:
+    session.info.pop("cache_invalidations", None)
+
+
+def clear_caches() -> None:
+    """Drop every in-process cache (tests, or after out-of-band writes)"""
+    _template_cache.clear()
+    _active_templates_cache.clear()
+    _access_stats_cache.clear()
+    _report_metrics_cache.clear()
+    _report_exports_cache.clear()
+
+
+def _fill(
+    cache: TTLCache, db: Session, key: Any, value: Any, generation: int, tag: Optional[Any] = None
+) -> None:
+    """Cache a value just read through ``db``, unless it may already be stale
+
+    Replica reads can lag a write that has just invalidated the entry, and a write
+    that lands while the query runs bumps the cache generation; either way the value
+    is returned to this caller but not stored.
+    """
+    if not db.info.get("replica"):
+        cache.set(key, value, tag=tag, generation=generation)
+
+
+_EPOCH = datetime(1970, 1, 1)
+_SECONDS_PER_DAY = 86400
+_PERIOD_SECONDS = {"daily": _SECONDS_PER_DAY, "weekly": 7 * _SECONDS_PER_DAY}
+
+
+@lru_cache(maxsize=1024)
+def _parse_hhmm(time_of_day: str) -> int:
+    """Seconds after midnight for an "HH:MM" string; ValueError when out of range"""
+    hour, minute = map(int, time_of_day.split(":"))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"time_of_day out of range: {time_of_day!r}")
+    return hour * 3600 + minute * 60
+
+
+def _detached_copy(obj: Any) -> Any:
+    """Column-only copy of a loaded row that any session can merge(load=False) without a SELECT"""
+    mapper = inspect(obj).mapper
+    copy = mapper.class_(**{attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+# Bulk inserts bind NULL for missing optional values instead of omitting the column;
+# otherwise rows with different None patterns split into separate executemany batches
+_INSERT_METRICS = insert(ReportMetric).execution_options(render_nulls=True)
+_INSERT_ACCESS_LOGS = insert(ReportAccess).execution_options(render_nulls=True)
+
+# Lister statements are built once; each ends in a COUNT(*) OVER () column that
+# carries the total match count on every row (see _paginate)
+_TOTAL = func.count().over()
+
+_TEMPLATES_BY_TYPE = (
+    select(ReportTemplate, _TOTAL)
+    .where(ReportTemplate.template_type == bindparam("template_type"), ReportTemplate.is_deleted == false())
+    .order_by(ReportTemplate.created_at.desc())
+)
+_ACTIVE_TEMPLATES = (
+    select(ReportTemplate, _TOTAL)
+    .where(ReportTemplate.is_deleted == false(), ReportTemplate.is_active == true())
+    .order_by(ReportTemplate.created_at.desc())
+)
+_USER_REPORTS = (
+    select(*REPORT_COLUMNS, _TOTAL)
+    .where(Report.user_id == bindparam("user_id"), Report.is_deleted == false())
+    .order_by(Report.created_at.desc(), Report.id.desc())
+)
+_USER_REPORTS_BY_STATUS = _USER_REPORTS.where(Report.status == bindparam("status"))
+# Keyset continuations: rows strictly older than the (created_at, id) cursor, without the
+# window total, which would have to count every remaining row before the LIMIT applies
+_AFTER_CURSOR = tuple_(bindparam("after_created_at", type_=DateTime), bindparam("after_id", type_=Integer))
+_USER_REPORTS_AFTER = (
+    select(*REPORT_COLUMNS)
+    .where(
+        Report.user_id == bindparam("user_id"),
+        Report.is_deleted == false(),
+        tuple_(Report.created_at, Report.id) < _AFTER_CURSOR,
+    )
+    .order_by(Report.created_at.desc(), Report.id.desc())
+)
+_USER_REPORTS_BY_STATUS_AFTER = _USER_REPORTS_AFTER.where(Report.status == bindparam("status"))
+# Per access type: count and successes; the distinct-user total rides along as a scalar subquery
+_DISTINCT_ACCESS = aliased(ReportAccess)
+_ACCESS_STATS = (
+    select(
+        ReportAccess.access_type,
+        func.count(),
+        func.sum(case((ReportAccess.access_status == "success", 1), else_=0)),
+        select(func.count(distinct(_DISTINCT_ACCESS.user_id)))
+        .where(_DISTINCT_ACCESS.report_id == bindparam("report_id"), _DISTINCT_ACCESS.is_deleted == false())
+        .scalar_subquery(),
+    )
+    .where(ReportAccess.report_id == bindparam("report_id"), ReportAccess.is_deleted == false())
+    .group_by(ReportAccess.access_type)
+)
+_DUE_SCHEDULES = select(ReportSchedule).where(
+    ReportSchedule.is_enabled == true(),
+    ReportSchedule.next_run_at <= bindparam("now"),
+    ReportSchedule.is_deleted == false(),
+)
+_USER_SCHEDULES = (
+    select(ReportSchedule, _TOTAL)
+    .where(ReportSchedule.user_id == bindparam("user_id"), ReportSchedule.is_deleted == false())
+    .order_by(ReportSchedule.created_at.desc(), ReportSchedule.id.desc())
+)
+_USER_SCHEDULES_AFTER = (
+    select(ReportSchedule)
+    .where(
+        ReportSchedule.user_id == bindparam("user_id"),
+        ReportSchedule.is_deleted == false(),
+        tuple_(ReportSchedule.created_at, ReportSchedule.id) < _AFTER_CURSOR,
+    )
+    .order_by(ReportSchedule.created_at.desc(), ReportSchedule.id.desc())
+)
+_REPORT_EXPORTS = (
+    select(ReportExport, _TOTAL)
+    .where(ReportExport.report_id == bindparam("report_id"), ReportExport.is_deleted == false())
+    .order_by(ReportExport.created_at.desc())
+)
+_REPORT_METRICS = (
+    select(*REPORT_METRIC_COLUMNS, _TOTAL)
+    .where(ReportMetric.report_id == bindparam("report_id"), ReportMetric.is_deleted == false())
+    .order_by(ReportMetric.recorded_at.desc())
+)
+_CATEGORY_METRICS = (
+    select(*REPORT_METRIC_COLUMNS, _TOTAL)
+    .where(ReportMetric.metric_category == bindparam("category"), ReportMetric.is_deleted == false())
+    .order_by(ReportMetric.recorded_at.desc())
+)
+_REPORT_ACCESS_LOGS = (
+    select(*REPORT_ACCESS_COLUMNS, _TOTAL)
+    .where(ReportAccess.report_id == bindparam("report_id"), ReportAccess.is_deleted == false())
+    .order_by(ReportAccess.accessed_at.desc())
+)
+_USER_ACCESS_LOGS = (
+    select(*REPORT_ACCESS_COLUMNS, _TOTAL)
+    .where(ReportAccess.user_id == bindparam("user_id"), ReportAccess.is_deleted == false())
+    .order_by(ReportAccess.accessed_at.desc())
+)
+# EXISTS stops at the first live log; the user variant seeks (report_id, user_id)
+_REPORT_ACCESSED = select(
+    exists().where(ReportAccess.report_id == bindparam("report_id"), ReportAccess.is_deleted == false())
+)
+_REPORT_ACCESSED_BY_USER = select(
+    exists().where(
+        ReportAccess.report_id == bindparam("report_id"),
+        ReportAccess.user_id == bindparam("user_id"),
+        ReportAccess.is_deleted == false(),
+    )
+)
+
+
+def _paginate(
+    db: Session, stmt: Select, params: Dict[str, Any], limit: int, offset: int
+) -> Tuple[List[Row], int]:
+    """Fetch one page of a lister statement and its total match count in a single round-trip"""
+    rows = db.execute(stmt.offset(offset).limit(limit), params).all()
+    if not rows:
+        if not offset:
+            return [], 0
+        # Past the last page there is no row to carry the window total
+        count = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return [], db.execute(count, params).scalar_one()
+    return [row[:-1] for row in rows], rows[0][-1]
+
+
+def _insert_returning_ids(db: Session, model: Any, rows: List[Dict[str, Any]], batch_size: int) -> List[int]:
+    """Insert rows and return their primary keys in input order
+
+    Paged multi-row INSERT ... RETURNING where the dialect has it. MySQL has no RETURNING
+    and does not promise consecutive ids for a multi-row INSERT, so there each row is
+    inserted alone and its id read from the cursor's lastrowid.
+    """
+    if db.get_bind().dialect.insert_returning:
+        stmt = (
+            insert(model)
+            .returning(model.id, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=batch_size, render_nulls=True)
+        )
+        return list(db.scalars(stmt, rows))
+    stmt = insert(model.__table__)  # a Core insert, so each result keeps inserted_primary_key
+    return [db.execute(stmt, row).inserted_primary_key[0] for row in rows]
+
+
+def _seek(
+    db: Session, stmt: Select, params: Dict[str, Any], after: Tuple[datetime, int], limit: int
+) -> List[Row]:
+    """Fetch the page after a (created_at, id) keyset cursor; cost stays flat however deep the page"""
+    after_created_at, after_id = after
+    cursor = {"after_created_at": after_created_at, "after_id": after_id}
+    return db.execute(stmt.limit(limit), {**params, **cursor}).all()
+
 
 class ReportTemplateService:
     """Manage report templates"""
@@ -44,45 +299,74 @@ class ReportTemplateService:
             template_name=template_name,
             template_type=template_type,
             description=description,
-            sections=json.dumps(sections) if sections else None,
-            export_formats=json.dumps(export_formats or ["pdf", "csv", "json"]),
-            is_default=1 if is_default else 0,
-            is_active=1,
+            sections=sections or None,
+            export_formats=export_formats or ["pdf", "csv", "json"],
+            is_default=is_default,
+            is_active=True,
         )
         db.add(template)
-        db.commit()
-        db.refresh(template)
+        db.flush()
+        _invalidate(db, _active_templates_cache.clear)
         return template
 
+    @staticmethod
+    def create_templates_bulk(
+        db: Session,
+        templates: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> List[int]:
+        """Create several templates with paged multi-row INSERTs; returns ids in input order"""
+        if not templates:
+            return []
+        rows = [
+            {
+                "template_name": t["template_name"],
+                "template_type": t["template_type"],
+                "description": t.get("description"),
+                "sections": t.get("sections") or None,
+                "export_formats": t.get("export_formats") or ["pdf", "csv", "json"],
+                "is_default": t.get("is_default", False),
+                "is_active": True,
+            }
+            for t in templates
+        ]
+        ids = _insert_returning_ids(db, ReportTemplate, rows, batch_size)
+        db.flush()
+        _invalidate(db, _active_templates_cache.clear)
+        return ids
+
     @staticmethod
     def get_template(db: Session, template_id: int) -> Optional[ReportTemplate]:
-        """Get template by ID"""
-        return (
-            db.query(ReportTemplate)
-            .filter(ReportTemplate.id == template_id, ReportTemplate.is_deleted == 0)
-            .first()
-        )
+        """Get template by ID, served from the in-process cache after the first load"""
+        cached = _template_cache.get(template_id)
+        if cached is not None:
+            return db.merge(cached, load=False)
+        generation = _template_cache.generation
+        template = _get_live(db, ReportTemplate, template_id)
+        if template is not None:
+            _fill(_template_cache, db, template_id, _detached_copy(template), generation)
+        return template
 
     @staticmethod
     def get_templates_by_type(
         db: Session, template_type: str, limit: int = 100, offset: int = 0
     ) -> Tuple[List[ReportTemplate], int]:
         """Get templates by type"""
-        query = db.query(ReportTemplate).filter(
-            ReportTemplate.template_type == template_type, ReportTemplate.is_deleted == 0
-        )
-        total = query.count()
-        templates = query.order_by(ReportTemplate.created_at.desc()).offset(offset).limit(limit).all()
-        return templates, total
+        page, total = _paginate(db, _TEMPLATES_BY_TYPE, {"template_type": template_type}, limit, offset)
+        return [row[0] for row in page], total
 
     @staticmethod
     def list_active_templates(db: Session, limit: int = 100, offset: int = 0) -> Tuple[List[ReportTemplate], int]:
-        """List all active templates"""
-        query = db.query(ReportTemplate).filter(
-            ReportTemplate.is_deleted == 0, ReportTemplate.is_active == 1
-        )
-        total = query.count()
-        templates = query.order_by(ReportTemplate.created_at.desc()).offset(offset).limit(limit).all()
+        """List all active templates (cached per page until a template is created)"""
+        cached = _active_templates_cache.get((limit, offset))
+        if cached is not None:
+            copies, total = cached
+            return [db.merge(t, load=False) for t in copies], total
+        generation = _active_templates_cache.generation
+        page, total = _paginate(db, _ACTIVE_TEMPLATES, {}, limit, offset)
+        templates = [row[0] for row in page]
+        copies = [_detached_copy(t) for t in templates]
+        _fill(_active_templates_cache, db, (limit, offset), (copies, total), generation)
         return templates, total
 
 
@@ -110,14 +394,41 @@ class ReportGenerationService:
             date_range_end=date_range_end,
             status="draft",
             progress_percent=0,
-            filters=json.dumps(filters) if filters else None,
+            filters=filters or None,
             generated_by="manual",
         )
         db.add(report)
-        db.commit()
-        db.refresh(report)
+        db.flush()
         return report
 
+    @staticmethod
+    def create_reports_bulk(
+        db: Session,
+        reports: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> List[int]:
+        """Create several draft reports with paged multi-row INSERTs; returns ids in input order"""
+        if not reports:
+            return []
+        rows = [
+            {
+                "user_id": r["user_id"],
+                "template_id": r["template_id"],
+                "report_name": r["report_name"],
+                "report_type": r["report_type"],
+                "date_range_start": r["date_range_start"],
+                "date_range_end": r["date_range_end"],
+                "status": "draft",
+                "progress_percent": 0,
+                "filters": r.get("filters") or None,
+                "generated_by": "manual",
+            }
+            for r in reports
+        ]
+        ids = _insert_returning_ids(db, Report, rows, batch_size)
+        db.flush()
+        return ids
+
     @staticmethod
     def update_report_status(
         db: Session,
@@ -125,16 +436,15 @@ class ReportGenerationService:
         status: str,
         progress_percent: int = 0,
         rows_generated: int = 0,
-    ) -> Optional[Report]:
-        """Update report generation status"""
-        report = db.query(Report).filter(Report.id == report_id, Report.is_deleted == 0).first()
-        if report:
-            report.status = status  # type: ignore[reportAttributeAccessIssue]
-            report.progress_percent = progress_percent  # type: ignore[reportAttributeAccessIssue]
-            report.rows_generated = rows_generated  # type: ignore[reportAttributeAccessIssue]
-            db.commit()
-            db.refresh(report)
-        return report
+    ) -> bool:
+        """Update report generation status; False if the report doesn't exist"""
+        return ReportGenerationService._patch_report(
+            db,
+            report_id,
+            status=status,
+            progress_percent=progress_percent,
+            rows_generated=rows_generated,
+        )
 
     @staticmethod
     def mark_report_completed(
@@ -144,34 +454,43 @@ class ReportGenerationService:
         generation_time: float,
         file_path: Optional[str] = None,
         file_size: Optional[int] = None,
-    ) -> Optional[Report]:
-        """Mark report as completed"""
-        report = db.query(Report).filter(Report.id == report_id, Report.is_deleted == 0).first()
-        if report:
-            report.status = "ready"  # type: ignore[reportAttributeAccessIssue]
-            report.total_records = total_records  # type: ignore[reportAttributeAccessIssue]
-            report.rows_generated = total_records  # type: ignore[reportAttributeAccessIssue]
-            report.progress_percent = 100  # type: ignore[reportAttributeAccessIssue]
-            report.generated_at = datetime.utcnow()  # type: ignore[reportAttributeAccessIssue]
-            report.generation_time_seconds = generation_time  # type: ignore[reportAttributeAccessIssue]
-            if file_path:
-                report.file_path = file_path  # type: ignore[reportAttributeAccessIssue]
-            if file_size:
-                report.file_size = file_size  # type: ignore[reportAttributeAccessIssue]
-            db.commit()
-            db.refresh(report)
-        return report
+    ) -> bool:
+        """Mark report as completed; False if the report doesn't exist"""
+        fields: Dict[str, Any] = {
+            "status": "ready",
+            "total_records": total_records,
+            "rows_generated": total_records,
+            "progress_percent": 100,
+            "generated_at": datetime.utcnow(),
+            "generation_time_seconds": generation_time,
+        }
+        if file_path:
+            fields["file_path"] = file_path
+        if file_size:
+            fields["file_size"] = file_size
+        return ReportGenerationService._patch_report(db, report_id, **fields)
 
     @staticmethod
-    def mark_report_failed(db: Session, report_id: int, error_message: str) -> Optional[Report]:
-        """Mark report as failed"""
-        report = db.query(Report).filter(Report.id == report_id, Report.is_deleted == 0).first()
-        if report:
-            report.status = "failed"  # type: ignore[reportAttributeAccessIssue]
-            report.error_message = error_message  # type: ignore[reportAttributeAccessIssue]
-            db.commit()
-            db.refresh(report)
-        return report
+    def mark_report_failed(db: Session, report_id: int, error_message: str) -> bool:
+        """Mark report as failed; False if the report doesn't exist"""
+        return ReportGenerationService._patch_report(
+            db, report_id, status="failed", error_message=error_message
+        )
+
+    @staticmethod
+    def _patch_report(db: Session, report_id: int, **fields: Any) -> bool:
+        """Apply a status transition as a single UPDATE, without loading the report first"""
+        result = db.execute(
+            update(Report)
+            .where(Report.id == report_id, Report.is_deleted == false())
+            .values(**fields)
+            .execution_options(synchronize_session=False)
+        )
+        # A copy already in this session would otherwise keep serving pre-UPDATE values
+        loaded = db.identity_map.get(identity_key(Report, report_id))
+        if loaded is not None:
+            db.expire(loaded)
+        return result.rowcount > 0
 
     @staticmethod
     def get_user_reports(
@@ -180,27 +499,39 @@ class ReportGenerationService:
         status: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> Tuple[List[Report], int]:
-        """Get user reports with optional status filtering"""
-        query = db.query(Report).filter(Report.user_id == user_id, Report.is_deleted == 0)
+        *,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[ReportDTO], Optional[int]]:
+        """Get user reports with optional status filtering
+
+        Pass the ``(created_at, id)`` of the last report served as ``after`` to continue
+        by keyset instead of OFFSET; such pages skip the total and return None for it.
+        """
+        params: Dict[str, Any] = {"user_id": user_id}
         if status:
-            query = query.filter(Report.status == status)
-        total = query.count()
-        reports = query.order_by(Report.created_at.desc()).offset(offset).limit(limit).all()
-        return reports, total
+            params["status"] = status
+        if after is not None:
+            stmt = _USER_REPORTS_BY_STATUS_AFTER if status else _USER_REPORTS_AFTER
+            return [ReportDTO(*row) for row in _seek(db, stmt, params, after, limit)], None
+        rows, total = _paginate(db, _USER_REPORTS_BY_STATUS if status else _USER_REPORTS, params, limit, offset)
+        return [ReportDTO(*row) for row in rows], total
 
     @staticmethod
     def get_report(db: Session, report_id: int, user_id: Optional[int] = None) -> Optional[Report]:
         """Get report by ID"""
-        query = db.query(Report).filter(Report.id == report_id, Report.is_deleted == 0)
         if user_id:
-            query = query.filter(Report.user_id == user_id)
-        return query.first()
+            return db.execute(
+                _REPORT_BY_ID_FOR_USER, {"id": report_id, "user_id": user_id}
+            ).scalar_one_or_none()
+        return _get_live(db, Report, report_id)
 
 
 class ReportScheduleService:
     """Manage report scheduling"""
 
+    # Clock for next-run calculations; swap it to pin "now" (tests) or reuse a cached tick
+    now_fn = staticmethod(datetime.utcnow)
+
     @staticmethod
     def create_schedule(
         db: Session,
@@ -221,72 +552,57 @@ class ReportScheduleService:
             frequency=frequency,
             time_of_day=time_of_day,
             timezone=timezone,
-            recipients=json.dumps(recipients) if recipients else None,
+            recipients=recipients or None,
             delivery_method=delivery_method,
-            is_enabled=1,
+            is_enabled=True,
         )
         # Set initial next_run_at
         setattr(schedule, "next_run_at", ReportScheduleService._calculate_next_run(frequency, time_of_day))
         db.add(schedule)
-        db.commit()
-        db.refresh(schedule)
+        db.flush()
         return schedule
 
     @staticmethod
     def _calculate_next_run(frequency: str, time_of_day: str) -> datetime:
         """Calculate next run time based on frequency"""
-        now = datetime.utcnow()
-        hour, minute = map(int, time_of_day.split(":"))
-        
-        if frequency == "daily":
-            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if next_run <= now:
-                next_run += timedelta(days=1)
-        elif frequency == "weekly":
-            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if next_run <= now:
-                next_run += timedelta(days=7)
-        elif frequency == "monthly":
-            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0, day=1)
+        now = ReportScheduleService.now_fn()
+        now_ts = (now - _EPOCH).total_seconds()
+        offset = _parse_hhmm(time_of_day)
+
+        if frequency in _PERIOD_SECONDS:
+            # POSIX days are exactly 86400s, so UTC midnight is plain integer math
+            next_ts = int(now_ts) // _SECONDS_PER_DAY * _SECONDS_PER_DAY + offset
+            if next_ts <= now_ts:
+                next_ts += _PERIOD_SECONDS[frequency]
+            return _EPOCH + timedelta(seconds=next_ts)
+
+        if frequency == "monthly":
+            next_run = datetime(now.year, now.month, 1) + timedelta(seconds=offset)
             if next_run <= now:
-                next_run += timedelta(days=32)
-                next_run = next_run.replace(day=1)
-        else:
-            next_run = now + timedelta(days=1)
-        
-        return next_run
+                year, month = divmod(now.year * 12 + now.month, 12)
+                next_run = datetime(year, month + 1, 1) + timedelta(seconds=offset)
+            return next_run
+
+        return now + timedelta(days=1)
 
     @staticmethod
     def get_schedules_due_for_execution(db: Session) -> List[ReportSchedule]:
         """Get schedules that are due for execution"""
-        now = datetime.utcnow()
-        return (
-            db.query(ReportSchedule)
-            .filter(
-                ReportSchedule.is_enabled == 1,
-                ReportSchedule.next_run_at <= now,
-                ReportSchedule.is_deleted == 0,
-            )
-            .all()
-        )
+        return list(db.scalars(_DUE_SCHEDULES, {"now": ReportScheduleService.now_fn()}))
 
     @staticmethod
     def update_schedule_after_execution(
         db: Session, schedule_id: int, success: bool
     ) -> Optional[ReportSchedule]:
         """Update schedule after execution"""
-        schedule = (
-            db.query(ReportSchedule)
-            .filter(ReportSchedule.id == schedule_id, ReportSchedule.is_deleted == 0)
-            .first()
-        )
+        schedule = _get_live(db, ReportSchedule, schedule_id)
         if schedule:
-            schedule.last_run_at = datetime.utcnow()  # type: ignore[reportAttributeAccessIssue]
-            schedule.run_count += 1  # type: ignore[reportAttributeAccessIssue]
+            schedule.last_run_at = ReportScheduleService.now_fn()
+            schedule.run_count += 1  # type: ignore[reportOptionalOperand]
             if success:
-                schedule.success_count += 1  # type: ignore[reportAttributeAccessIssue]
+                schedule.success_count += 1  # type: ignore[reportOptionalOperand]
             else:
-                schedule.failure_count += 1  # type: ignore[reportAttributeAccessIssue]
+                schedule.failure_count += 1  # type: ignore[reportOptionalOperand]
                 setattr(
                     schedule,
                     "next_run_at",
@@ -295,21 +611,70 @@ class ReportScheduleService:
                         getattr(schedule, "time_of_day", "00:00")
                     )
                 )
-            db.commit()
-            db.refresh(schedule)
+            db.flush()
         return schedule
 
+    @staticmethod
+    def update_schedules_after_execution(db: Session, outcomes: Dict[int, bool]) -> int:
+        """Record a scheduler tick's outcomes ({schedule_id: success}) with one UPDATE per outcome"""
+        if not outcomes:
+            return 0
+        now = ReportScheduleService.now_fn()
+        succeeded = [schedule_id for schedule_id, success in outcomes.items() if success]
+        failed = [schedule_id for schedule_id, success in outcomes.items() if not success]
+        live = ReportSchedule.is_deleted == false()
+        updated = 0
+
+        if succeeded:
+            updated += db.execute(
+                update(ReportSchedule)
+                .where(ReportSchedule.id.in_(succeeded), live)
+                .values(
+                    last_run_at=now,
+                    run_count=ReportSchedule.run_count + 1,
+                    success_count=ReportSchedule.success_count + 1,
+                )
+            ).rowcount
+
+        if failed:
+            next_runs = {
+                schedule_id: ReportScheduleService._calculate_next_run(
+                    frequency or "daily", time_of_day or "00:00"
+                )
+                for schedule_id, frequency, time_of_day in db.execute(
+                    select(ReportSchedule.id, ReportSchedule.frequency, ReportSchedule.time_of_day)
+                    .where(ReportSchedule.id.in_(failed), live)
+                )
+            }
+            if next_runs:
+                updated += db.execute(
+                    update(ReportSchedule)
+                    .where(ReportSchedule.id.in_(next_runs), live)
+                    .values(
+                        last_run_at=now,
+                        run_count=ReportSchedule.run_count + 1,
+                        failure_count=ReportSchedule.failure_count + 1,
+                        next_run_at=case(next_runs, value=ReportSchedule.id),
+                    )
+                ).rowcount
+
+        db.flush()
+        return updated
+
     @staticmethod
     def get_user_schedules(
-        db: Session, user_id: int, limit: int = 100, offset: int = 0
-    ) -> Tuple[List[ReportSchedule], int]:
-        """Get schedules for a user"""
-        query = db.query(ReportSchedule).filter(
-            ReportSchedule.user_id == user_id, ReportSchedule.is_deleted == 0
-        )
-        total = query.count()
-        schedules = query.order_by(ReportSchedule.created_at.desc()).offset(offset).limit(limit).all()
-        return schedules, total
+        db: Session,
+        user_id: int,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[ReportSchedule], Optional[int]]:
+        """Get schedules for a user (``after``: keyset cursor as in get_user_reports)"""
+        if after is not None:
+            return [row[0] for row in _seek(db, _USER_SCHEDULES_AFTER, {"user_id": user_id}, after, limit)], None
+        page, total = _paginate(db, _USER_SCHEDULES, {"user_id": user_id}, limit, offset)
+        return [row[0] for row in page], total
 
 
 class ReportExportService:
@@ -332,8 +697,8 @@ class ReportExportService:
             export_status="pending",
         )
         db.add(export)
-        db.commit()
-        db.refresh(export)
+        db.flush()
+        _invalidate(db, _report_exports_cache.pop_tag, report_id)
         return export
 
     @staticmethod
@@ -341,65 +706,58 @@ class ReportExportService:
         db: Session,
         export_id: int,
         file_size: Optional[int] = None,
-        file_hash: Optional[str] = None,
+        file_hash: Optional[bytes] = None,
     ) -> Optional[ReportExport]:
-        """Mark export as completed"""
-        export = (
-            db.query(ReportExport)
-            .filter(ReportExport.id == export_id, ReportExport.is_deleted == 0)
-            .first()
-        )
+        """Mark export as completed; file_hash is the raw hashlib.sha256 digest"""
+        export = _get_live(db, ReportExport, export_id)
         if export:
-            export.export_status = "completed"  # type: ignore[reportAttributeAccessIssue]
-            export.exported_at = datetime.utcnow()  # type: ignore[reportAttributeAccessIssue]
+            export.export_status = "completed"
+            export.exported_at = datetime.utcnow()
             if file_size:
-                export.file_size = file_size  # type: ignore[reportAttributeAccessIssue]
+                export.file_size = file_size
             if file_hash:
-                export.file_hash = file_hash  # type: ignore[reportAttributeAccessIssue]
-            db.commit()
-            db.refresh(export)
+                export.file_hash = file_hash
+            db.flush()
+            _invalidate(db, _report_exports_cache.pop_tag, export.report_id)
         return export
 
     @staticmethod
     def mark_export_failed(db: Session, export_id: int, error_message: str) -> Optional[ReportExport]:
         """Mark export as failed"""
-        export = (
-            db.query(ReportExport)
-            .filter(ReportExport.id == export_id, ReportExport.is_deleted == 0)
-            .first()
-        )
+        export = _get_live(db, ReportExport, export_id)
         if export:
-            export.export_status = "failed"  # type: ignore[reportAttributeAccessIssue]
-            export.error_message = error_message  # type: ignore[reportAttributeAccessIssue]
-            db.commit()
-            db.refresh(export)
+            export.export_status = "failed"
+            export.error_message = error_message
+            db.flush()
+            _invalidate(db, _report_exports_cache.pop_tag, export.report_id)
         return export
 
     @staticmethod
     def record_download(db: Session, export_id: int) -> Optional[ReportExport]:
         """Record an export download"""
-        export = (
-            db.query(ReportExport)
-            .filter(ReportExport.id == export_id, ReportExport.is_deleted == 0)
-            .first()
-        )
+        export = _get_live(db, ReportExport, export_id)
         if export:
-            export.download_count += 1  # type: ignore[reportAttributeAccessIssue]
-            export.last_downloaded_at = datetime.utcnow()  # type: ignore[reportAttributeAccessIssue]
-            db.commit()
-            db.refresh(export)
+            export.download_count += 1  # type: ignore[reportOptionalOperand]
+            export.last_downloaded_at = datetime.utcnow()
+            db.flush()
+            _invalidate(db, _report_exports_cache.pop_tag, export.report_id)
         return export
 
     @staticmethod
     def get_report_exports(
         db: Session, report_id: int, limit: int = 100, offset: int = 0
     ) -> Tuple[List[ReportExport], int]:
-        """Get exports for a report"""
-        query = db.query(ReportExport).filter(
-            ReportExport.report_id == report_id, ReportExport.is_deleted == 0
-        )
-        total = query.count()
-        exports = query.order_by(ReportExport.created_at.desc()).offset(offset).limit(limit).all()
+        """Get exports for a report (cached per page until the report's exports change)"""
+        key = (report_id, limit, offset)
+        cached = _report_exports_cache.get(key)
+        if cached is not None:
+            copies, total = cached
+            return [db.merge(e, load=False) for e in copies], total
+        generation = _report_exports_cache.generation
+        page, total = _paginate(db, _REPORT_EXPORTS, {"report_id": report_id}, limit, offset)
+        exports = [row[0] for row in page]
+        copies = [_detached_copy(e) for e in exports]
+        _fill(_report_exports_cache, db, key, (copies, total), generation, tag=report_id)
         return exports, total
 
 
@@ -414,6 +772,7 @@ class ReportMetricsService:
         metric_value: float,
         metric_unit: str,
         metric_category: str = "performance",
+        recorded_at: Optional[datetime] = None,
     ) -> ReportMetric:
         """Record a report metric"""
         metric = ReportMetric(
@@ -423,58 +782,93 @@ class ReportMetricsService:
             metric_unit=metric_unit,
             metric_category=metric_category,
         )
+        if recorded_at:
+            metric.recorded_at = recorded_at
         db.add(metric)
-        db.commit()
-        db.refresh(metric)
+        db.flush()
+        _invalidate(db, _report_metrics_cache.pop_tag, report_id)
         return metric
 
+    @staticmethod
+    def record_metrics_bulk(
+        db: Session,
+        metrics: List[Dict[str, Any]],
+        recorded_at: Optional[datetime] = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """Record several metrics with batched multi-row INSERTs, sharing one timestamp"""
+        if not metrics:
+            return 0
+        recorded_at = recorded_at or datetime.utcnow()
+        rows = [
+            {
+                "report_id": m["report_id"],
+                "metric_name": m["metric_name"],
+                "metric_value": m["metric_value"],
+                "metric_unit": m["metric_unit"],
+                "metric_category": m.get("metric_category", "performance"),
+                "recorded_at": m.get("recorded_at", recorded_at),
+            }
+            for m in metrics
+        ]
+        for start in range(0, len(rows), batch_size):
+            db.execute(_INSERT_METRICS, rows[start:start + batch_size])
+        db.flush()
+        for report_id in {row["report_id"] for row in rows}:
+            _invalidate(db, _report_metrics_cache.pop_tag, report_id)
+        return len(rows)
+
     @staticmethod
     def get_report_metrics(
         db: Session, report_id: int, limit: int = 100, offset: int = 0
-    ) -> Tuple[List[ReportMetric], int]:
-        """Get metrics for a report"""
-        query = db.query(ReportMetric).filter(
-            ReportMetric.report_id == report_id, ReportMetric.is_deleted == 0
-        )
-        total = query.count()
-        metrics = query.order_by(ReportMetric.recorded_at.desc()).offset(offset).limit(limit).all()
-        return metrics, total
+    ) -> Tuple[List[ReportMetricDTO], int]:
+        """Get metrics for a report (cached per page until the report records a metric)"""
+        key = (report_id, limit, offset)
+        cached = _report_metrics_cache.get(key)
+        if cached is None:
+            # Rows are cached as tuples; every caller gets DTOs of its own
+            generation = _report_metrics_cache.generation
+            rows, total = _paginate(db, _REPORT_METRICS, {"report_id": report_id}, limit, offset)
+            cached = ([tuple(row) for row in rows], total)
+            _fill(_report_metrics_cache, db, key, cached, generation, tag=report_id)
+        rows, total = cached
+        return [ReportMetricDTO(*row) for row in rows], total
 
     @staticmethod
     def get_metrics_by_category(
         db: Session, category: str, limit: int = 100, offset: int = 0
-    ) -> Tuple[List[ReportMetric], int]:
+    ) -> Tuple[List[ReportMetricDTO], int]:
         """Get metrics by category"""
-        query = db.query(ReportMetric).filter(
-            ReportMetric.metric_category == category, ReportMetric.is_deleted == 0
-        )
-        total = query.count()
-        metrics = query.order_by(ReportMetric.recorded_at.desc()).offset(offset).limit(limit).all()
-        return metrics, total
+        rows, total = _paginate(db, _CATEGORY_METRICS, {"category": category}, limit, offset)
+        return [ReportMetricDTO(*row) for row in rows], total
 
     @staticmethod
     def get_average_metrics(db: Session, metric_name: str, days: int = 30) -> Dict[str, Any]:
         """Get average metrics over time period"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        metrics = (
-            db.query(ReportMetric)
+        average, count, minimum, maximum = (
+            db.query(
+                func.avg(ReportMetric.metric_value),
+                func.count(),
+                func.min(ReportMetric.metric_value),
+                func.max(ReportMetric.metric_value),
+            )
             .filter(
                 ReportMetric.metric_name == metric_name,
                 ReportMetric.recorded_at >= cutoff_date,
-                ReportMetric.is_deleted == 0,
+                ReportMetric.is_deleted == false(),
             )
-            .all()
+            .one()
         )
-        
-        if not metrics:
+
+        if not count:
             return {"average": 0, "count": 0, "min": 0, "max": 0}
-        
-        values = [float(m.metric_value) for m in metrics]  # type: ignore[reportArgumentType]
+
         return {
-            "average": sum(values) / len(values),
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
+            "average": average,
+            "count": count,
+            "min": minimum,
+            "max": maximum,
         }
 
 
@@ -505,64 +899,114 @@ class ReportAccessService:
             access_duration_seconds=duration_seconds,
         )
         db.add(log)
-        db.commit()
-        db.refresh(log)
+        db.flush()
+        _invalidate(db, _access_stats_cache.pop, report_id)
         return log
 
+    @staticmethod
+    def log_access_core(
+        db: Session,
+        report_id: int,
+        user_id: int,
+        access_type: str,
+        access_status: str = "success",
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        error_message: Optional[str] = None,
+        duration_seconds: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Log report access with a Core INSERT, bypassing the ORM unit of work"""
+        row = {
+            "report_id": report_id,
+            "user_id": user_id,
+            "access_type": access_type,
+            "access_status": access_status,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "error_message": error_message,
+            "access_duration_seconds": duration_seconds,
+            "accessed_at": datetime.utcnow(),
+        }
+        result = db.execute(ReportAccess.__table__.insert(), row)
+        db.flush()
+        _invalidate(db, _access_stats_cache.pop, report_id)
+        row["id"] = result.inserted_primary_key[0]
+        return row
+
+    @staticmethod
+    def log_access_bulk(
+        db: Session,
+        logs: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """Log a burst of report accesses with batched multi-row INSERTs"""
+        if not logs:
+            return 0
+        accessed_at = datetime.utcnow()
+        rows = [
+            {
+                "report_id": log["report_id"],
+                "user_id": log["user_id"],
+                "access_type": log["access_type"],
+                "access_status": log.get("access_status", "success"),
+                "ip_address": log.get("ip_address"),
+                "user_agent": log.get("user_agent"),
+                "error_message": log.get("error_message"),
+                "access_duration_seconds": log.get("duration_seconds"),
+                "accessed_at": log.get("accessed_at", accessed_at),
+            }
+            for log in logs
+        ]
+        for start in range(0, len(rows), batch_size):
+            db.execute(_INSERT_ACCESS_LOGS, rows[start:start + batch_size])
+        db.flush()
+        for report_id in {row["report_id"] for row in rows}:
+            _invalidate(db, _access_stats_cache.pop, report_id)
+        return len(rows)
+
     @staticmethod
     def get_report_access_logs(
         db: Session, report_id: int, limit: int = 100, offset: int = 0
-    ) -> Tuple[List[ReportAccess], int]:
+    ) -> Tuple[List[ReportAccessDTO], int]:
         """Get access logs for a report"""
-        query = db.query(ReportAccess).filter(
-            ReportAccess.report_id == report_id, ReportAccess.is_deleted == 0
-        )
-        total = query.count()
-        logs = query.order_by(ReportAccess.accessed_at.desc()).offset(offset).limit(limit).all()
-        return logs, total
+        rows, total = _paginate(db, _REPORT_ACCESS_LOGS, {"report_id": report_id}, limit, offset)
+        return [ReportAccessDTO(*row) for row in rows], total
 
     @staticmethod
     def get_user_access_logs(
         db: Session, user_id: int, limit: int = 100, offset: int = 0
-    ) -> Tuple[List[ReportAccess], int]:
+    ) -> Tuple[List[ReportAccessDTO], int]:
         """Get access logs for a user"""
-        query = db.query(ReportAccess).filter(
-            ReportAccess.user_id == user_id, ReportAccess.is_deleted == 0
-        )
-        total = query.count()
-        logs = query.order_by(ReportAccess.accessed_at.desc()).offset(offset).limit(limit).all()
-        return logs, total
+        rows, total = _paginate(db, _USER_ACCESS_LOGS, {"user_id": user_id}, limit, offset)
+        return [ReportAccessDTO(*row) for row in rows], total
+
+    @staticmethod
+    def has_any_access(db: Session, report_id: int, user_id: Optional[int] = None) -> bool:
+        """Whether a report (optionally by one user) has any access log, without reading a page"""
+        if user_id is None:
+            return db.execute(_REPORT_ACCESSED, {"report_id": report_id}).scalar_one()
+        return db.execute(_REPORT_ACCESSED_BY_USER, {"report_id": report_id, "user_id": user_id}).scalar_one()
 
     @staticmethod
     def get_access_statistics(db: Session, report_id: int) -> Dict[str, Any]:
-        """Get access statistics for a report"""
-        logs = (
-            db.query(ReportAccess)
-            .filter(ReportAccess.report_id == report_id, ReportAccess.is_deleted == 0)
-            .all()
-        )
-        
-        if not logs:
-            return {
-                "total_accesses": 0,
-                "successful": 0,
-                "failed": 0,
-                "by_type": {},
-                "unique_users": 0,
-            }
-        
-        by_type = {}
-        for log in logs:
-            if log.access_type not in by_type:
-                by_type[log.access_type] = 0
-            by_type[log.access_type] += 1
-        
-        unique_users = len(set(log.user_id for log in logs))
-        successful = len([l for l in logs if getattr(l, "access_status", None) == "success"])
-        return {
-            "total_accesses": len(logs),
+        """Get access statistics for a report (one GROUP BY query, cached until the next access log)"""
+        cached = _access_stats_cache.get(report_id)
+        if cached is not None:
+            return {**cached, "by_type": dict(cached["by_type"])}
+
+        generation = _access_stats_cache.generation
+        by_type: Dict[str, int] = {}
+        total = successful = unique_users = 0
+        for access_type, count, ok, unique_users in db.execute(_ACCESS_STATS, {"report_id": report_id}):
+            by_type[access_type] = count
+            total += count
+            successful += int(ok)  # SUM() comes back as Decimal on MySQL
+        stats = {
+            "total_accesses": total,
             "successful": successful,
-            "failed": len(logs) - successful,
+            "failed": total - successful,
             "by_type": by_type,
             "unique_users": unique_users,
         }
+        _fill(_access_stats_cache, db, report_id, stats, generation)
+        return {**stats, "by_type": dict(by_type)}
@@ -0,0 +1,27 @@
+"""
+Reporting Service - Response Classes
+
+orjson-backed JSON response used as the application's default response class.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson (datetimes, dataclasses and Decimals included)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
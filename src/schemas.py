@@ -0,0 +1,118 @@
+"""
+Reporting Service Response Schemas
+
+Pydantic models declared as response_model on the write endpoints. FastAPI
+serializes these through pydantic-core instead of walking the result with
+jsonable_encoder. Read endpoints return pre-serialized ORJSONResponse bodies,
+so their schemas only document the payload in OpenAPI.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TemplateCreated(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    template_name: str
+    template_type: str
+    created_at: datetime
+
+
+class TemplateOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    template_name: str
+    template_type: str
+    description: Optional[str] = None
+    is_default: bool
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class ReportCreated(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    report_name: str
+    status: str
+    created_at: datetime
+
+
+class ReportOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    template_id: int
+    report_name: str
+    report_type: str
+    date_range_start: datetime
+    date_range_end: datetime
+    status: str
+    progress_percent: Optional[int] = None
+    total_records: Optional[int] = None
+    generated_at: Optional[datetime] = None
+    file_size: Optional[int] = None
+    generation_time_seconds: Optional[float] = None
+    created_at: datetime
+
+
+class ReportStatusUpdated(BaseModel):
+    status: str
+    progress: Optional[int] = None
+
+
+class ScheduleCreated(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    schedule_name: str
+    frequency: str
+    next_run_at: Optional[datetime] = None
+    created_at: datetime
+
+
+class ScheduleExecuted(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    next_run_at: Optional[datetime] = None
+    run_count: Optional[int] = None
+
+
+class ExportCreated(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    export_format: str
+    export_status: str
+    created_at: datetime
+
+
+class ExportDownloaded(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    download_count: Optional[int] = None
+    last_downloaded_at: Optional[datetime] = None
+
+
+class MetricRecorded(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    metric_name: str
+    metric_value: float
+    recorded_at: datetime
+
+
+class AccessQueued(BaseModel):
+    report_id: int
+    user_id: int
+    access_type: str
+    access_status: str
+    accessed_at: datetime
@@ -0,0 +1,184 @@
+"""
+Reporting Service - Shared Test Fixtures
+
+One in-memory database per run, one outer transaction per test class, and a
+SAVEPOINT per test.
+"""
+
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, ContextManager, Generator, List
+
+import pytest
+
+# Make the ``src`` package importable however pytest is invoked
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+
+from src.models import Base, Report, ReportSchedule, ReportTemplate
+from src.reporting_service import ReportScheduleService, clear_caches
+
+
+# ============================================================================
+# TEST FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    """One in-memory SQLite database for the whole run; the schema is created once
+
+    ``sqlite://`` is private to the process, so each pytest-xdist worker gets its own.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def session_factory() -> sessionmaker:
+    """Session settings shared by every test; only the connection differs"""
+    return sessionmaker(autoflush=False, expire_on_commit=False, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture(scope="class")
+def db_connection(db_engine: Engine) -> Generator[Connection, None, None]:
+    """Connection and outer transaction per test class, rolled back once the class is done"""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="function")
+def db(db_connection: Connection, session_factory: sessionmaker) -> Generator[Session, None, None]:
+    """Session inside a SAVEPOINT that is rolled back after each test
+
+    Commits (by a test or the access-log buffer) only release nested SAVEPOINTs,
+    so a test's writes never leak into the next test; class-scoped sample rows stay put.
+    """
+    savepoint = db_connection.begin_nested()
+    db_session = session_factory(bind=db_connection)
+    clear_caches()
+    yield db_session
+    db_session.close()
+    savepoint.rollback()
+
+
+@pytest.fixture
+def count_queries(db: Session) -> Callable[[], ContextManager[List[str]]]:
+    """``with count_queries() as statements:`` collects the SQL the test's connection runs"""
+
+    @contextmanager
+    def _count() -> Generator[List[str], None, None]:
+        statements: List[str] = []
+        connection = db.connection()
+
+        def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+    return _count
+
+
+def _insert(connection: Connection, model: type, **values) -> int:
+    """Core INSERT of one row, returning its id (no ORM unit of work)"""
+    table = model.__table__
+    return connection.execute(table.insert().returning(table.c.id), values).scalar_one()
+
+
+@pytest.fixture(scope="class")
+def sample_template_id(db_connection: Connection) -> int:
+    """Insert the sample template once per test class"""
+    return _insert(
+        db_connection,
+        ReportTemplate,
+        template_name="Sales Report",
+        template_type="sales",
+        description="Monthly sales analysis",
+        sections=["summary", "details", "trends"],
+        export_formats=["pdf", "csv", "xlsx"],
+        is_default=False,
+        is_active=True,
+    )
+
+
+@pytest.fixture(scope="class")
+def sample_report_id(db_connection: Connection, sample_template_id: int) -> int:
+    """Insert the sample report once per test class"""
+    return _insert(
+        db_connection,
+        Report,
+        user_id=1,
+        template_id=sample_template_id,
+        report_name="Q1 Sales Report",
+        report_type="sales",
+        date_range_start=datetime(2024, 1, 1),
+        date_range_end=datetime(2024, 3, 31),
+        status="draft",
+        progress_percent=0,
+        filters={"region": "US"},
+        generated_by="manual",
+    )
+
+
+@pytest.fixture(scope="class")
+def sample_schedule_id(db_connection: Connection, sample_template_id: int) -> int:
+    """Insert the sample schedule once per test class"""
+    return _insert(
+        db_connection,
+        ReportSchedule,
+        user_id=1,
+        template_id=sample_template_id,
+        schedule_name="Weekly Sales",
+        frequency="weekly",
+        time_of_day="09:00",
+        timezone="UTC",
+        recipients=["admin@example.com"],
+        delivery_method="email",
+        is_enabled=True,
+        next_run_at=ReportScheduleService._calculate_next_run("weekly", "09:00"),
+    )
+
+
+@pytest.fixture
+def sample_template(db: Session, sample_template_id: int):
+    """The class's sample template, loaded into this test's session"""
+    return db.get(ReportTemplate, sample_template_id)
+
+
+@pytest.fixture
+def sample_report(db: Session, sample_report_id: int):
+    """The class's sample report, loaded into this test's session"""
+    return db.get(Report, sample_report_id)
+
+
+@pytest.fixture
+def sample_schedule(db: Session, sample_schedule_id: int):
+    """The class's sample schedule, loaded into this test's session"""
+    return db.get(ReportSchedule, sample_schedule_id)
@@ -4,19 +4,19 @@ Reporting Service - Comprehensive Test Suite
 Tests for templates, report generation, scheduling, exports, metrics, and access logging.
 """
 
-import sys
-import pytest
+import hashlib
 from datetime import datetime, timedelta
-from typing import Generator
-from pathlib import Path
-
-sys.path.insert(0, str((Path(__file__).parent.parent / "src")))
+from typing import List
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-
-from src.models import Base
-from src.main import app, get_db, SessionLocal
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload, Session
+
+from src.models import Report, ReportTemplate
+from src.access_log_buffer import AccessLogBuffer
+from src.cache import TTLCache
+from src.dto import ReportDTO
 from src.reporting_service import (
     ReportTemplateService,
     ReportGenerationService,
@@ -24,71 +24,16 @@ from src.reporting_service import (
     ReportExportService,
     ReportMetricsService,
     ReportAccessService,
+    _ACCESS_STATS,
+    _parse_hhmm,
 )
 
 
-# ============================================================================
-# TEST FIXTURES
-# ============================================================================
-
-
-@pytest.fixture(scope="function")
-def db() -> Generator[Session, None, None]:
-    """Create in-memory SQLite database for testing"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(bind=engine)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db_session = SessionLocal()
-    yield db_session
-    db_session.close()
-
-
-@pytest.fixture
-def sample_template(db: Session):
-    """Create a sample template"""
-    return ReportTemplateService.create_template(
-        db=db,
-        template_name="Sales Report",
-        template_type="sales",
-        description="Monthly sales analysis",
-        sections=["summary", "details", "trends"],
-        export_formats=["pdf", "csv", "xlsx"],
-    )
-
-
-@pytest.fixture
-def sample_report(db: Session, sample_template):
-    """Create a sample report"""
-    template_id = getattr(sample_template, "id", None)
-    assert template_id is not None
-    return ReportGenerationService.create_report(
-        db=db,
-        user_id=1,
-        template_id=template_id,
-        report_name="Q1 Sales Report",
-        report_type="sales",
-        date_range_start=datetime(2024, 1, 1),
-        date_range_end=datetime(2024, 3, 31),
-        filters={"region": "US"},
-    )
-
-
-@pytest.fixture
-def sample_schedule(db: Session, sample_template):
-    """Create a sample schedule"""
-    template_id = getattr(sample_template, "id", None)
-    assert template_id is not None
-    return ReportScheduleService.create_schedule(
-        db=db,
-        user_id=1,
-        template_id=template_id,
-        schedule_name="Weekly Sales",
-        frequency="weekly",
-        time_of_day="09:00",
-        timezone="UTC",
-        recipients=["admin@example.com"],
-        delivery_method="email",
-    )
+def _require_id(obj) -> int:
+    """Primary key of a flushed instance, read from its loaded state (never triggers a load)"""
+    obj_id = obj.__dict__.get("id")
+    assert obj_id is not None
+    return obj_id
 
 
 # ============================================================================
@@ -112,11 +57,22 @@ class TestReportTemplateService:
         assert template.id is not None
         assert getattr(template, "template_name", None) == "Analytics Report"
         assert getattr(template, "template_type", None) == "analytics"
-        assert getattr(template, "is_active", None) == 1
-
-    def test_get_template(self, db: Session, sample_template):
+        assert getattr(template, "is_active", None) is True
+        db.expire(template)
+        assert template.sections == ["overview", "metrics"]
+        assert template.export_formats == ["pdf", "json"]
+
+    def test_server_timestamp_compares_with_bound_datetime(self, db: Session, sample_template_id: int):
+        """Test a server-stamped created_at equals the same datetime bound as a parameter"""
+        created_at = db.scalar(select(ReportTemplate.created_at).where(ReportTemplate.id == sample_template_id))
+        matches = select(ReportTemplate.id).where(ReportTemplate.created_at == created_at)
+        assert db.scalars(matches).all() == [sample_template_id]
+        newer = select(ReportTemplate.id).where(ReportTemplate.created_at > created_at)
+        assert db.scalars(newer).all() == []
+
+    def test_get_template(self, db: Session, sample_template_id: int):
         """Test retrieving a template"""
-        retrieved = ReportTemplateService.get_template(db, sample_template.id)
+        retrieved = ReportTemplateService.get_template(db, sample_template_id)
         assert retrieved is not None
         assert getattr(retrieved, "template_name", None) == "Sales Report"
 
@@ -125,14 +81,27 @@ class TestReportTemplateService:
         retrieved = ReportTemplateService.get_template(db, 9999)
         assert retrieved is None
 
-    def test_get_templates_by_type(self, db: Session, sample_template):
+    def test_get_template_cached(self, db: Session, sample_template_id: int, count_queries):
+        """Test repeat lookups are served without a SELECT"""
+        template_id = sample_template_id
+        ReportTemplateService.get_template(db, template_id)
+        db.expunge_all()
+
+        with count_queries() as statements:
+            template = ReportTemplateService.get_template(db, template_id)
+
+        assert statements == []
+        assert template.template_name == "Sales Report"
+        assert template.sections == ["summary", "details", "trends"]
+
+    def test_get_templates_by_type(self, db: Session, sample_template_id: int):
         """Test getting templates by type"""
         templates, total = ReportTemplateService.get_templates_by_type(db, "sales")
         assert total == 1
         assert len(templates) == 1
         assert getattr(templates[0], "template_type", None) == "sales"
 
-    def test_list_active_templates(self, db: Session, sample_template):
+    def test_list_active_templates(self, db: Session, sample_template_id: int):
         """Test listing active templates"""
         templates, total = ReportTemplateService.list_active_templates(db)
         assert total == 1
@@ -147,10 +116,9 @@ class TestReportTemplateService:
 class TestReportGenerationService:
     """Tests for ReportGenerationService"""
 
-    def test_create_report(self, db: Session, sample_template):
+    def test_create_report(self, db: Session, sample_template_id: int):
         """Test creating a report"""
-        template_id = getattr(sample_template, "id", None)
-        assert template_id is not None
+        template_id = sample_template_id
         report = ReportGenerationService.create_report(
             db=db,
             user_id=1,
@@ -164,23 +132,70 @@ class TestReportGenerationService:
         assert getattr(report, "status", None) == "draft"
         assert getattr(report, "progress_percent", None) == 0
 
-    def test_update_report_status(self, db: Session, sample_report):
+    def test_create_reports_bulk(self, db: Session, sample_template_id: int):
+        """Test bulk report creation returns ids in input order"""
+        template_id = sample_template_id
+        ids = ReportGenerationService.create_reports_bulk(
+            db,
+            [
+                {
+                    "user_id": 2,
+                    "template_id": template_id,
+                    "report_name": f"Bulk {i}",
+                    "report_type": "sales",
+                    "date_range_start": datetime(2024, 1, 1),
+                    "date_range_end": datetime(2024, 1, 31),
+                }
+                for i in range(5)
+            ],
+            batch_size=2,
+        )
+        assert len(ids) == 5
+        assert [ReportGenerationService.get_report(db, i).report_name for i in ids] == [f"Bulk {i}" for i in range(5)]
+        reports, total = ReportGenerationService.get_user_reports(db, 2)
+        assert total == 5
+        assert {r.status for r in reports} == {"draft"}
+
+    def test_create_reports_bulk_without_returning(self, db: Session, sample_template_id: int, monkeypatch):
+        """Test the MySQL path (no INSERT ... RETURNING) still returns ids in input order"""
+        monkeypatch.setattr(db.get_bind().dialect, "insert_returning", False)
+        ids = ReportGenerationService.create_reports_bulk(
+            db,
+            [
+                {
+                    "user_id": 5,
+                    "template_id": sample_template_id,
+                    "report_name": f"Row {i}",
+                    "report_type": "sales",
+                    "date_range_start": datetime(2024, 1, 1),
+                    "date_range_end": datetime(2024, 1, 31),
+                }
+                for i in range(3)
+            ],
+        )
+        assert [ReportGenerationService.get_report(db, i).report_name for i in ids] == [f"Row {i}" for i in range(3)]
+
+    def test_update_report_status(self, db: Session, sample_report_id: int):
         """Test updating report status"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         updated = ReportGenerationService.update_report_status(
             db=db,
             report_id=report_id,
             status="generating",
             progress_percent=50,
         )
-        assert getattr(updated, "status", None) == "generating"
-        assert getattr(updated, "progress_percent", None) == 50
+        assert updated is True
+        report = ReportGenerationService.get_report(db, report_id)
+        assert getattr(report, "status", None) == "generating"
+        assert getattr(report, "progress_percent", None) == 50
 
-    def test_mark_report_completed(self, db: Session, sample_report):
+    def test_update_report_status_not_found(self, db: Session):
+        """Test status updates on a missing report report False"""
+        assert ReportGenerationService.update_report_status(db, 999, "generating") is False
+
+    def test_mark_report_completed(self, db: Session, sample_report_id: int):
         """Test marking report as completed"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         completed = ReportGenerationService.mark_report_completed(
             db=db,
             report_id=report_id,
@@ -189,30 +204,119 @@ class TestReportGenerationService:
             file_path="/reports/q1_sales.pdf",
             file_size=524288,
         )
+        assert completed is True
+        completed = ReportGenerationService.get_report(db, report_id)
         assert getattr(completed, "status", None) == "ready"
         assert getattr(completed, "progress_percent", None) == 100
         assert getattr(completed, "total_records", None) == 1000
 
-    def test_mark_report_failed(self, db: Session, sample_report):
+    def test_mark_report_failed(self, db: Session, sample_report_id: int):
         """Test marking report as failed"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         failed = ReportGenerationService.mark_report_failed(
             db=db,
             report_id=report_id,
             error_message="Database connection timeout",
         )
+        assert failed is True
+        failed = ReportGenerationService.get_report(db, report_id)
         assert getattr(failed, "status", None) == "failed"
         assert getattr(failed, "error_message", None) == "Database connection timeout"
 
-    def test_get_user_reports(self, db: Session, sample_report):
+    def test_get_user_reports(self, db: Session, sample_report_id: int):
         """Test getting user reports"""
         reports, total = ReportGenerationService.get_user_reports(db, user_id=1)
         assert total == 1
         assert len(reports) == 1
         assert getattr(reports[0], "user_id", None) == 1
 
-    def test_get_user_reports_by_status(self, db: Session, sample_report):
+    def test_get_user_reports_returns_dtos(self, db: Session, sample_report):
+        """Test list rows are column-selected DTOs matching the model shape"""
+        reports, _ = ReportGenerationService.get_user_reports(db, user_id=1)
+        assert isinstance(reports[0], ReportDTO)
+        assert reports[0].to_dict() == sample_report.to_dict()
+
+    def test_user_reports_use_partial_index(self, db: Session):
+        """Test the soft-delete partial index serves the user/status lookup"""
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM reports "
+                "WHERE user_id = :user_id AND status = :status AND is_deleted = :is_deleted"
+            ),
+            {"user_id": 1, "status": "draft", "is_deleted": 0},
+        ).all()
+        assert any("idx_reports_user_status" in row[-1] for row in plan)
+
+    def test_report_template_selectinload(self, db: Session, sample_report_id: int, sample_template_id: int):
+        """Test the template relationship batch-loads with selectinload"""
+        template_id = sample_template_id
+        db.expunge_all()
+        reports = db.query(Report).options(selectinload(Report.template)).all()
+        assert "template" in reports[0].__dict__
+        assert reports[0].template.id == template_id
+
+    def test_get_user_reports_no_n_plus_1(self, db: Session, sample_template_id: int, count_queries):
+        """Test listing a user's reports is one query however many reports there are"""
+        ReportGenerationService.create_reports_bulk(
+            db,
+            [
+                {
+                    "user_id": 3,
+                    "template_id": sample_template_id,
+                    "report_name": f"Report {i}",
+                    "report_type": "sales",
+                    "date_range_start": datetime(2024, 1, 1),
+                    "date_range_end": datetime(2024, 1, 31),
+                }
+                for i in range(10)
+            ],
+        )
+        db.expunge_all()
+        with count_queries() as statements:
+            dtos, total = ReportGenerationService.get_user_reports(db, user_id=3)
+        assert (len(dtos), total, len(statements)) == (10, 10, 1)
+
+    def test_report_template_never_lazy_loads(self, db: Session, sample_report_id: int):
+        """Test touching an unloaded relationship raises instead of emitting a query"""
+        db.expunge_all()
+        report = db.query(Report).one()
+        with pytest.raises(InvalidRequestError):
+            report.template
+
+    def test_get_user_reports_pagination_total(self, db: Session, sample_report_id: int):
+        """Test the window total holds on a short page and past the last page"""
+        reports, total = ReportGenerationService.get_user_reports(db, user_id=1, limit=1)
+        assert (len(reports), total) == (1, 1)
+        reports, total = ReportGenerationService.get_user_reports(db, user_id=1, offset=5)
+        assert (reports, total) == ([], 1)
+
+    def test_get_user_reports_keyset(self, db: Session, sample_template_id: int):
+        """Test keyset pages walk every report once, newest first, ties broken by id"""
+        ids = ReportGenerationService.create_reports_bulk(
+            db,
+            [
+                {
+                    "user_id": 4,
+                    "template_id": sample_template_id,
+                    "report_name": f"Keyset {i}",
+                    "report_type": "sales",
+                    "date_range_start": datetime(2024, 1, 1),
+                    "date_range_end": datetime(2024, 1, 31),
+                }
+                for i in range(5)
+            ],
+        )
+        seen, after = [], None
+        for _ in range(5):
+            page, total = ReportGenerationService.get_user_reports(db, user_id=4, limit=2, after=after)
+            assert total == (5 if after is None else None)
+            seen += [r.id for r in page]
+            if len(page) < 2:
+                break
+            after = (page[-1].created_at, page[-1].id)
+        assert seen == sorted(ids, reverse=True)
+
+    def test_get_user_reports_by_status(self, db: Session, sample_report_id: int):
         """Test getting user reports by status"""
         reports, total = ReportGenerationService.get_user_reports(
             db, user_id=1, status="draft"
@@ -220,14 +324,21 @@ class TestReportGenerationService:
         assert total == 1
         assert len(reports) == 1
 
-    def test_get_report(self, db: Session, sample_report):
+    def test_get_report(self, db: Session, sample_report_id: int):
         """Test retrieving a report"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         retrieved = ReportGenerationService.get_report(db, report_id)
         assert retrieved is not None
         assert getattr(retrieved, "report_name", None) == "Q1 Sales Report"
 
+    def test_get_report_ignores_soft_deleted(self, db: Session, sample_report):
+        """Test identity-map lookups still hide soft-deleted reports"""
+        report_id = sample_report.id
+        sample_report.is_deleted = True
+        db.flush()
+        assert ReportGenerationService.get_report(db, report_id) is None
+        assert ReportGenerationService.get_report(db, report_id, user_id=1) is None
+
 
 # ============================================================================
 # REPORT SCHEDULE SERVICE TESTS
@@ -237,10 +348,9 @@ class TestReportGenerationService:
 class TestReportScheduleService:
     """Tests for ReportScheduleService"""
 
-    def test_create_schedule(self, db: Session, sample_template):
+    def test_create_schedule(self, db: Session, sample_template_id: int):
         """Test creating a schedule"""
-        template_id = getattr(sample_template, "id", None)
-        assert template_id is not None
+        template_id = sample_template_id
         schedule = ReportScheduleService.create_schedule(
             db=db,
             user_id=1,
@@ -252,30 +362,70 @@ class TestReportScheduleService:
         )
         assert getattr(schedule, "id", None) is not None
         assert getattr(schedule, "frequency", None) == "daily"
-        assert getattr(schedule, "is_enabled", None) == 1
+        assert getattr(schedule, "is_enabled", None) is True
 
-    def test_calculate_next_run_daily(self, db: Session):
+    def test_calculate_next_run_daily(self, monkeypatch):
         """Test daily schedule calculation"""
-        # Should be tomorrow at 08:00 if past that time today
-        next_run = ReportScheduleService._calculate_next_run("daily", "08:00")
-        assert isinstance(next_run, datetime)
-
-    def test_calculate_next_run_weekly(self, db: Session):
+        monkeypatch.setattr(ReportScheduleService, "now_fn", staticmethod(lambda: datetime(2024, 1, 31, 10)))
+        # Tomorrow if the time already passed today, else later today
+        assert ReportScheduleService._calculate_next_run("daily", "08:00") == datetime(2024, 2, 1, 8)
+        assert ReportScheduleService._calculate_next_run("daily", "12:30") == datetime(2024, 1, 31, 12, 30)
+        # Repeat schedules reuse the parsed HH:MM instead of re-splitting it
+        hits = _parse_hhmm.cache_info().hits
+        assert ReportScheduleService._calculate_next_run("daily", "08:00") == datetime(2024, 2, 1, 8)
+        assert _parse_hhmm.cache_info().hits == hits + 1
+
+    @pytest.mark.parametrize("time_of_day", ["25:00", "9:75", "-1:00"])
+    def test_calculate_next_run_rejects_out_of_range_time(self, time_of_day: str):
+        """Test an impossible time of day raises instead of rolling over"""
+        with pytest.raises(ValueError):
+            ReportScheduleService._calculate_next_run("daily", time_of_day)
+
+    def test_calculate_next_run_weekly(self, monkeypatch):
         """Test weekly schedule calculation"""
-        next_run = ReportScheduleService._calculate_next_run("weekly", "08:00")
-        assert isinstance(next_run, datetime)
+        monkeypatch.setattr(ReportScheduleService, "now_fn", staticmethod(lambda: datetime(2024, 1, 31, 10)))
+        assert ReportScheduleService._calculate_next_run("weekly", "08:00") == datetime(2024, 2, 7, 8)
+        assert ReportScheduleService._calculate_next_run("weekly", "12:30") == datetime(2024, 1, 31, 12, 30)
+
+    def test_calculate_next_run_monthly(self, monkeypatch):
+        """Test monthly schedule calculation lands on the 1st"""
+        monkeypatch.setattr(ReportScheduleService, "now_fn", staticmethod(lambda: datetime(2024, 12, 15, 10)))
+        assert ReportScheduleService._calculate_next_run("monthly", "08:30") == datetime(2025, 1, 1, 8, 30)
 
-    def test_get_schedules_due_for_execution(self, db: Session, sample_schedule):
+    def test_get_schedules_due_for_execution(self, db: Session, sample_schedule, count_queries):
         """Test getting schedules due for execution"""
         sample_schedule.next_run_at = datetime.utcnow() - timedelta(hours=1)
-        db.commit()
-        due_schedules = ReportScheduleService.get_schedules_due_for_execution(db)
+        db.flush()
+        with count_queries() as statements:
+            due_schedules = ReportScheduleService.get_schedules_due_for_execution(db)
         assert len(due_schedules) == 1
-
-    def test_update_schedule_after_execution(self, db: Session, sample_schedule):
+        assert len(statements) == 1
+        assert "report_schedules.next_run_at <= ?" in statements[0]
+
+    def test_schedule_clock_is_swappable(self, db: Session, sample_schedule, monkeypatch):
+        """Test due lookups and run stamps read the clock through now_fn"""
+        later = sample_schedule.next_run_at + timedelta(minutes=1)
+        monkeypatch.setattr(ReportScheduleService, "now_fn", staticmethod(lambda: later))
+        assert [s.id for s in ReportScheduleService.get_schedules_due_for_execution(db)] == [sample_schedule.id]
+        updated = ReportScheduleService.update_schedule_after_execution(db, sample_schedule.id, success=True)
+        assert getattr(updated, "last_run_at", None) == later
+
+    def test_due_schedules_use_index(self, db: Session):
+        """Test the scheduler's due lookup is an index range search, not a table scan"""
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM report_schedules "
+                "WHERE is_enabled = 1 AND next_run_at <= :now AND is_deleted = 0"
+            ),
+            {"now": datetime.utcnow()},
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "SEARCH" in details and "idx_report_schedules_due" in details
+        assert "SCAN" not in details
+
+    def test_update_schedule_after_execution(self, db: Session, sample_schedule_id: int):
         """Test updating schedule after execution"""
-        schedule_id = getattr(sample_schedule, "id", None)
-        assert schedule_id is not None
+        schedule_id = sample_schedule_id
         updated = ReportScheduleService.update_schedule_after_execution(
             db=db,
             schedule_id=schedule_id,
@@ -285,12 +435,40 @@ class TestReportScheduleService:
         assert getattr(updated, "run_count", None) == 1
         assert getattr(updated, "success_count", None) == 1
 
-    def test_get_user_schedules(self, db: Session, sample_schedule):
+    def test_update_schedules_after_execution(self, db: Session, sample_template_id: int, sample_schedule):
+        """Test recording a batch of schedule outcomes in one transaction"""
+        failing = ReportScheduleService.create_schedule(
+            db=db,
+            user_id=1,
+            template_id=sample_template_id,
+            schedule_name="Daily Sales",
+            frequency="daily",
+            time_of_day="06:00",
+        )
+        failing.next_run_at = datetime(2000, 1, 1)
+        db.flush()
+        updated = ReportScheduleService.update_schedules_after_execution(
+            db, {sample_schedule.id: True, failing.id: False}
+        )
+        assert updated == 2
+        db.expire_all()
+        assert (sample_schedule.run_count, sample_schedule.success_count) == (1, 1)
+        assert (failing.run_count, failing.failure_count) == (1, 1)
+        assert failing.next_run_at > datetime.utcnow()
+
+    def test_get_user_schedules(self, db: Session, sample_schedule_id: int):
         """Test getting user schedules"""
         schedules, total = ReportScheduleService.get_user_schedules(db, user_id=1)
         assert total == 1
         assert len(schedules) == 1
 
+    def test_get_user_schedules_keyset(self, db: Session, sample_schedule):
+        """Test a keyset page after the only schedule is empty and skips the total"""
+        rest, total = ReportScheduleService.get_user_schedules(
+            db, user_id=1, after=(sample_schedule.created_at, sample_schedule.id)
+        )
+        assert (rest, total) == ([], None)
+
 
 # ============================================================================
 # REPORT EXPORT SERVICE TESTS
@@ -300,10 +478,9 @@ class TestReportScheduleService:
 class TestReportExportService:
     """Tests for ReportExportService"""
 
-    def test_create_export(self, db: Session, sample_report):
+    def test_create_export(self, db: Session, sample_report_id: int):
         """Test creating an export"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         export = ReportExportService.create_export(
             db=db,
             report_id=report_id,
@@ -315,39 +492,39 @@ class TestReportExportService:
         assert getattr(export, "export_format", None) == "pdf"
         assert getattr(export, "export_status", None) == "pending"
 
-    def test_mark_export_completed(self, db: Session, sample_report):
+    def test_mark_export_completed(self, db: Session, sample_report_id: int, count_queries):
         """Test marking export as completed"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         export = ReportExportService.create_export(
             db=db,
             report_id=report_id,
             export_format="pdf",
             file_path="/exports/report_123.pdf",
         )
-        export_id = getattr(export, "id", None)
-        assert export_id is not None
-        completed = ReportExportService.mark_export_completed(
-            db=db,
-            export_id=export_id,
-            file_size=524288,
-            file_hash="abc123def456",
-        )
+        export_id = _require_id(export)
+        with count_queries() as statements:
+            completed = ReportExportService.mark_export_completed(
+                db=db,
+                export_id=export_id,
+                file_size=524288,
+                file_hash=hashlib.sha256(b"report_123").digest(),
+            )
+        # The export is still in the identity map, so only the UPDATE reaches the database
+        assert [sql.split()[0] for sql in statements if not sql.startswith(("SAVEPOINT", "RELEASE"))] == ["UPDATE"]
         assert getattr(completed, "export_status", None) == "completed"
         assert getattr(completed, "exported_at", None) is not None
+        assert getattr(completed, "file_hash", None) == hashlib.sha256(b"report_123").digest()
 
-    def test_mark_export_failed(self, db: Session, sample_report):
+    def test_mark_export_failed(self, db: Session, sample_report_id: int):
         """Test marking export as failed"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         export = ReportExportService.create_export(
             db=db,
             report_id=report_id,
             export_format="xlsx",
             file_path="/exports/report_123.xlsx",
         )
-        export_id = getattr(export, "id", None)
-        assert export_id is not None
+        export_id = _require_id(export)
         failed = ReportExportService.mark_export_failed(
             db=db,
             export_id=export_id,
@@ -355,27 +532,30 @@ class TestReportExportService:
         )
         assert getattr(failed, "export_status", None) == "failed"
 
-    def test_record_download(self, db: Session, sample_report):
-        """Test recording export download"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
-        export = ReportExportService.create_export(
-            db=db,
-            report_id=report_id,
-            export_format="pdf",
-            file_path="/exports/report_123.pdf",
-        )
-        export_id = getattr(export, "id", None)
-        assert export_id is not None
-        ReportExportService.mark_export_completed(db, export_id)
-        downloaded = ReportExportService.record_download(db, export_id)
+    def test_record_download(self, db: Session, sample_report_id: int, count_queries):
+        """Test recording export download; the create/complete/download chain commits once"""
+        report_id = sample_report_id
+        with count_queries() as statements:
+            export = ReportExportService.create_export(
+                db=db,
+                report_id=report_id,
+                export_format="pdf",
+                file_path="/exports/report_123.pdf",
+            )
+            export_id = _require_id(export)
+            ReportExportService.mark_export_completed(db, export_id)
+            download_start = len(statements)
+            downloaded = ReportExportService.record_download(db, export_id)
+            db.commit()
+        assert not any(sql.startswith("SELECT") for sql in statements[download_start:])
+        # Services only flush; the test's commit (a SAVEPOINT release here) is the only one
+        assert len([sql for sql in statements if sql.startswith(("COMMIT", "RELEASE SAVEPOINT"))]) == 1
         assert getattr(downloaded, "download_count", None) == 1
         assert getattr(downloaded, "last_downloaded_at", None) is not None
 
-    def test_get_report_exports(self, db: Session, sample_report):
+    def test_get_report_exports(self, db: Session, sample_report_id: int):
         """Test getting report exports"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         ReportExportService.create_export(
             db=db,
             report_id=report_id,
@@ -386,6 +566,22 @@ class TestReportExportService:
         assert total == 1
         assert len(exports) == 1
 
+    def test_get_report_exports_cached_until_export_changes(self, db: Session, sample_report_id: int, count_queries):
+        """Test an exports page is cached and refreshes after the export is completed"""
+        report_id = sample_report_id
+        export = ReportExportService.create_export(
+            db=db, report_id=report_id, export_format="csv", file_path="/exports/report.csv"
+        )
+        with count_queries() as statements:
+            ReportExportService.get_report_exports(db, report_id)
+            ReportExportService.get_report_exports(db, report_id)
+        assert len(statements) == 1
+
+        ReportExportService.mark_export_completed(db, _require_id(export), file_size=42)
+        exports, total = ReportExportService.get_report_exports(db, report_id)
+        assert total == 1
+        assert getattr(exports[0], "export_status", None) == "completed"
+
 
 # ============================================================================
 # REPORT METRICS SERVICE TESTS
@@ -395,10 +591,9 @@ class TestReportExportService:
 class TestReportMetricsService:
     """Tests for ReportMetricsService"""
 
-    def test_record_metric(self, db: Session, sample_report):
+    def test_record_metric(self, db: Session, sample_report_id: int):
         """Test recording a metric"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         metric = ReportMetricsService.record_metric(
             db=db,
             report_id=report_id,
@@ -410,10 +605,50 @@ class TestReportMetricsService:
         assert getattr(metric, "id", None) is not None
         assert getattr(metric, "metric_value", None) == 2.5
 
-    def test_get_report_metrics(self, db: Session, sample_report):
+    def test_record_metrics_bulk(self, db: Session, sample_report_id: int):
+        """Test recording several metrics in one insert"""
+        report_id = sample_report_id
+        inserted = ReportMetricsService.record_metrics_bulk(
+            db,
+            [
+                {
+                    "report_id": report_id,
+                    "metric_name": "generation_time",
+                    "metric_value": 2.5,
+                    "metric_unit": "seconds",
+                },
+                {
+                    "report_id": report_id,
+                    "metric_name": "page_count",
+                    "metric_value": 12,
+                    "metric_unit": "pages",
+                    "metric_category": "usage",
+                },
+            ],
+        )
+        assert inserted == 2
+        metrics, total = ReportMetricsService.get_report_metrics(db, report_id)
+        assert total == 2
+        assert {getattr(m, "metric_name", None) for m in metrics} == {"generation_time", "page_count"}
+        assert len({getattr(m, "recorded_at", None) for m in metrics}) == 1
+
+    def test_record_metric_with_timestamp(self, db: Session, sample_report_id: int):
+        """Test recording a metric with a caller-supplied timestamp"""
+        report_id = sample_report_id
+        recorded_at = datetime(2024, 4, 1, 12, 0, 0)
+        metric = ReportMetricsService.record_metric(
+            db=db,
+            report_id=report_id,
+            metric_name="generation_time",
+            metric_value=1.5,
+            metric_unit="seconds",
+            recorded_at=recorded_at,
+        )
+        assert getattr(metric, "recorded_at", None) == recorded_at
+
+    def test_get_report_metrics(self, db: Session, sample_report_id: int):
         """Test getting report metrics"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         ReportMetricsService.record_metric(
             db=db,
             report_id=report_id,
@@ -425,10 +660,40 @@ class TestReportMetricsService:
         assert total == 1
         assert len(metrics) == 1
 
-    def test_get_metrics_by_category(self, db: Session, sample_report):
+    def test_get_report_metrics_cached_until_next_metric(self, db: Session, sample_report_id: int, count_queries):
+        """Test a metrics page takes one SELECT, is then cached, and refreshes after a new metric"""
+        report_id = sample_report_id
+        ReportMetricsService.record_metric(db=db, report_id=report_id, metric_name="rows", metric_value=10, metric_unit="count")
+        with count_queries() as statements:
+            ReportMetricsService.get_report_metrics(db, report_id)
+            metrics, total = ReportMetricsService.get_report_metrics(db, report_id)
+        assert len(statements) == 1
+        assert (len(metrics), total) == (1, 1)
+
+        ReportMetricsService.record_metric(db=db, report_id=report_id, metric_name="rows", metric_value=20, metric_unit="count")
+        metrics, total = ReportMetricsService.get_report_metrics(db, report_id)
+        assert (len(metrics), total) == (2, 2)
+
+    def test_get_report_metrics_cache_returns_own_dtos(self, db: Session, sample_report_id: int):
+        """Test callers served from the cache never share DTO instances"""
+        ReportMetricsService.record_metric(db=db, report_id=sample_report_id, metric_name="rows", metric_value=10, metric_unit="count")
+        first, _ = ReportMetricsService.get_report_metrics(db, sample_report_id)
+        first[0].metric_value = -1
+        second, _ = ReportMetricsService.get_report_metrics(db, sample_report_id)
+        assert second[0] is not first[0]
+        assert second[0].metric_value == 10
+
+    def test_replica_session_does_not_fill_metrics_cache(self, db: Session, sample_report_id: int, count_queries):
+        """Test a page read from a (possibly lagging) replica is served but not cached"""
+        db.info["replica"] = True
+        with count_queries() as statements:
+            ReportMetricsService.get_report_metrics(db, sample_report_id)
+            ReportMetricsService.get_report_metrics(db, sample_report_id)
+        assert len(statements) == 2
+
+    def test_get_metrics_by_category(self, db: Session, sample_report_id: int):
         """Test getting metrics by category"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         ReportMetricsService.record_metric(
             db=db,
             report_id=report_id,
@@ -443,30 +708,37 @@ class TestReportMetricsService:
         assert total == 1
         assert len(metrics) == 1
 
-    def test_get_average_metrics(self, db: Session, sample_report):
+    def test_get_average_metrics(self, db: Session, sample_report_id: int, count_queries):
         """Test getting average metrics"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
-        ReportMetricsService.record_metric(
-            db=db,
-            report_id=report_id,
-            metric_name="generation_time",
-            metric_value=2.0,
-            metric_unit="seconds",
-        )
-        ReportMetricsService.record_metric(
-            db=db,
-            report_id=report_id,
-            metric_name="generation_time",
-            metric_value=4.0,
-            metric_unit="seconds",
+        report_id = sample_report_id
+        ReportMetricsService.record_metrics_bulk(
+            db,
+            [
+                {"report_id": report_id, "metric_name": "generation_time", "metric_value": value, "metric_unit": "seconds"}
+                for value in (2.0, 4.0)
+            ],
         )
-        stats = ReportMetricsService.get_average_metrics(db, "generation_time")
+        with count_queries() as statements:
+            stats = ReportMetricsService.get_average_metrics(db, "generation_time")
+        assert len(statements) == 1
         assert stats["average"] == 3.0
         assert stats["count"] == 2
         assert stats["min"] == 2.0
         assert stats["max"] == 4.0
 
+    def test_average_metrics_use_name_window_index(self, db: Session):
+        """Test the metric window aggregate seeks the name/recorded_at index"""
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT AVG(metric_value), COUNT(*), MIN(metric_value), MAX(metric_value) "
+                "FROM report_metrics WHERE metric_name = :name AND recorded_at >= :cutoff AND is_deleted = 0"
+            ),
+            {"name": "generation_time", "cutoff": datetime.utcnow() - timedelta(days=30)},
+        ).all()
+        assert any(
+            row[-1].startswith("SEARCH") and "idx_report_metrics_name_recorded" in row[-1] for row in plan
+        )
+
 
 # ============================================================================
 # REPORT ACCESS SERVICE TESTS
@@ -476,10 +748,9 @@ class TestReportMetricsService:
 class TestReportAccessService:
     """Tests for ReportAccessService"""
 
-    def test_log_access(self, db: Session, sample_report):
+    def test_log_access(self, db: Session, sample_report_id: int):
         """Test logging report access"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         log = ReportAccessService.log_access(
             db=db,
             report_id=report_id,
@@ -492,10 +763,92 @@ class TestReportAccessService:
         assert getattr(log, "id", None) is not None
         assert getattr(log, "access_type", None) == "view"
 
-    def test_get_report_access_logs(self, db: Session, sample_report):
+    def test_log_access_core(self, db: Session, sample_report_id: int):
+        """Test logging report access through the Core insert path"""
+        report_id = sample_report_id
+        log = ReportAccessService.log_access_core(
+            db=db,
+            report_id=report_id,
+            user_id=1,
+            access_type="download",
+            ip_address="192.168.1.1",
+        )
+        assert log["id"] is not None
+        assert log["access_type"] == "download"
+        logs, total = ReportAccessService.get_report_access_logs(db, report_id)
+        assert total == 1
+        assert getattr(logs[0], "id", None) == log["id"]
+
+    def test_log_access_bulk(self, db: Session, sample_report_id: int):
+        """Test logging a burst of accesses across several insert batches"""
+        report_id = sample_report_id
+        inserted = ReportAccessService.log_access_bulk(
+            db,
+            [
+                {"report_id": report_id, "user_id": user_id, "access_type": "view"}
+                for user_id in range(1, 6)
+            ],
+            batch_size=2,
+        )
+        assert inserted == 5
+        logs, total = ReportAccessService.get_report_access_logs(db, report_id)
+        assert total == 5
+        assert {getattr(l, "access_status", None) for l in logs} == {"success"}
+
+    def test_log_access_bulk_is_one_insert(self, db: Session, sample_report_id: int, count_queries):
+        """Test a 100-event burst is written with a single INSERT statement"""
+        events = [
+            {"report_id": sample_report_id, "user_id": i % 7, "access_type": "view", "ip_address": "10.0.0.1"}
+            for i in range(100)
+        ]
+        with count_queries() as statements:
+            inserted = ReportAccessService.log_access_bulk(db, events)
+        assert inserted == 100
+        assert len([sql for sql in statements if sql.startswith("INSERT")]) == 1
+
+    def test_access_log_statements_reuse_compiled_sql(self, db: Session, sample_report_id: int):
+        """Test the hot access-log statements compile once and are then served from the SQL cache"""
+        connection = db.connection()
+        cache_hits: List[bool] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+            cache_hits.append(context.cache_hit is context.dialect.CACHE_HIT)
+
+        def _hot_path() -> None:
+            ReportAccessService.log_access(db=db, report_id=sample_report_id, user_id=1, access_type="view")
+            ReportAccessService.get_report_access_logs(db, sample_report_id)
+            ReportAccessService.get_user_access_logs(db, 1)
+            ReportAccessService.get_access_statistics(db, sample_report_id)
+
+        _hot_path()
+        event.listen(connection, "after_cursor_execute", _record)
+        try:
+            _hot_path()
+        finally:
+            event.remove(connection, "after_cursor_execute", _record)
+        assert cache_hits and all(cache_hits)
+
+    def test_access_log_pages_read_in_index_order(self, db: Session):
+        """Test newest-first log pages per report and per user come off an index without a sort"""
+        listings = (
+            ("report_id", "idx_report_access_report_accessed"),
+            ("user_id", "idx_report_access_user_accessed"),
+        )
+        for column, index in listings:
+            plan = db.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id, access_type, accessed_at FROM report_access_logs "
+                    f"WHERE {column} = :key AND is_deleted = 0 ORDER BY accessed_at DESC LIMIT 100"
+                ),
+                {"key": 1},
+            ).all()
+            details = " ".join(row[-1] for row in plan)
+            assert "SEARCH" in details and index in details
+            assert "TEMP B-TREE" not in details
+
+    def test_get_report_access_logs(self, db: Session, sample_report_id: int):
         """Test getting report access logs"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         ReportAccessService.log_access(
             db=db,
             report_id=report_id,
@@ -506,10 +859,9 @@ class TestReportAccessService:
         assert total == 1
         assert len(logs) == 1
 
-    def test_get_user_access_logs(self, db: Session, sample_report):
+    def test_get_user_access_logs(self, db: Session, sample_report_id: int):
         """Test getting user access logs"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
+        report_id = sample_report_id
         ReportAccessService.log_access(
             db=db,
             report_id=report_id,
@@ -520,29 +872,132 @@ class TestReportAccessService:
         assert total == 1
         assert len(logs) == 1
 
-    def test_get_access_statistics(self, db: Session, sample_report):
+    def test_has_any_access(self, db: Session, sample_report_id: int, count_queries):
+        """Test the existence check answers per report and per user in one query each"""
+        report_id = sample_report_id
+        assert ReportAccessService.has_any_access(db, report_id) is False
+        ReportAccessService.log_access(db=db, report_id=report_id, user_id=1, access_type="view")
+        with count_queries() as statements:
+            assert ReportAccessService.has_any_access(db, report_id) is True
+        assert len(statements) == 1
+        assert ReportAccessService.has_any_access(db, report_id, user_id=1) is True
+        assert ReportAccessService.has_any_access(db, report_id, user_id=2) is False
+
+    def test_get_access_statistics(self, db: Session, sample_report_id: int):
         """Test getting access statistics"""
-        report_id = getattr(sample_report, "id", None)
-        assert report_id is not None
-        ReportAccessService.log_access(
-            db=db,
-            report_id=report_id,
-            user_id=1,
-            access_type="view",
-            access_status="success",
-        )
-        ReportAccessService.log_access(
-            db=db,
-            report_id=report_id,
-            user_id=2,
-            access_type="download",
-            access_status="success",
+        report_id = sample_report_id
+        ReportAccessService.log_access_bulk(
+            db,
+            [
+                {"report_id": report_id, "user_id": 1, "access_type": "view"},
+                {"report_id": report_id, "user_id": 2, "access_type": "download"},
+            ],
         )
         stats = ReportAccessService.get_access_statistics(db, report_id)
         assert stats["total_accesses"] == 2
         assert stats["successful"] == 2
+        assert stats["failed"] == 0
+        assert stats["by_type"] == {"view": 1, "download": 1}
         assert stats["unique_users"] == 2
 
+    def test_access_statistics_plan_seeks_report_index(self, db: Session):
+        """Test both halves of the statistics query seek the report index instead of scanning the log"""
+        sql = _ACCESS_STATS.params(report_id=1).compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+        plan = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        searches = [row[-1] for row in plan if "report_access_logs" in row[-1]]
+        assert len(searches) == 2
+        assert all(detail.startswith("SEARCH") and "(report_id=?)" in detail for detail in searches)
+
+    def test_access_statistics_cached_until_next_log(self, db: Session, sample_report_id: int, count_queries):
+        """Test statistics take one SELECT, are then cached, and refresh after a new access log"""
+        report_id = sample_report_id
+        ReportAccessService.log_access_bulk(
+            db,
+            [
+                {"report_id": report_id, "user_id": 1, "access_type": "view"},
+                {"report_id": report_id, "user_id": 2, "access_type": "view"},
+            ],
+        )
+        with count_queries() as statements:
+            ReportAccessService.get_access_statistics(db, report_id)
+            ReportAccessService.get_access_statistics(db, report_id)
+        assert len(statements) == 1
+
+        ReportAccessService.log_access(
+            db=db, report_id=report_id, user_id=1, access_type="download", access_status="failed"
+        )
+        stats = ReportAccessService.get_access_statistics(db, report_id)
+        assert (stats["total_accesses"], stats["successful"], stats["failed"]) == (3, 2, 1)
+        assert stats["by_type"] == {"view": 2, "download": 1}
+        assert stats["unique_users"] == 2
+
+
+# ============================================================================
+# CACHE TESTS
+# ============================================================================
+
+
+class TestTTLCache:
+    """Tests for TTLCache"""
+
+    def test_set_skipped_after_concurrent_invalidation(self):
+        """Test a value read before an invalidation is not stored after it"""
+        cache = TTLCache()
+        generation = cache.generation
+        cache.pop("report")  # a write lands while the reader is still querying
+        assert cache.set("report", "stale", generation=generation) is False
+        assert cache.get("report") is None
+        assert cache.set("report", "fresh", generation=cache.generation) is True
+        assert cache.get("report") == "fresh"
+
+    def test_pop_tag_drops_every_page_and_maxsize_bounds_pages(self):
+        """Test tagged pages are bounded by maxsize and dropped together"""
+        cache = TTLCache(maxsize=3)
+        for offset in range(5):
+            cache.set((1, 100, offset), offset, tag=1)
+        cache.set((2, 100, 0), "other", tag=2)
+        assert len(cache) == 3
+        cache.pop_tag(1)
+        assert len(cache) == 1
+        assert cache.get((2, 100, 0)) == "other"
+
+
+# ============================================================================
+# ACCESS LOG BUFFER TESTS
+# ============================================================================
+
+
+class TestAccessLogBuffer:
+    """Tests for AccessLogBuffer"""
+
+    def test_flush_writes_queued_logs_in_one_batch(
+        self, db: Session, db_connection, session_factory, sample_report_id: int, count_queries
+    ):
+        """Test queued logs stay in memory until flushed, then land with one INSERT"""
+        report_id = sample_report_id
+        buffer = AccessLogBuffer(lambda: session_factory(bind=db_connection), batch_size=10)
+        buffer.put(report_id, 1, "view")
+        buffer.put(report_id, 2, "download", access_status="failed", duration_seconds=3)
+        assert buffer.pending() == 2
+        assert ReportAccessService.get_access_statistics(db, report_id)["total_accesses"] == 0
+
+        with count_queries() as statements:
+            assert buffer.flush() == 2
+        assert sum(sql.startswith("INSERT") for sql in statements) == 1
+        assert buffer.pending() == 0
+
+        stats = ReportAccessService.get_access_statistics(db, report_id)
+        assert (stats["total_accesses"], stats["failed"]) == (2, 1)
+
+    def test_stop_drains_queue(self, db: Session, db_connection, session_factory, sample_report_id: int):
+        """Test stopping the buffer writes whatever is still queued"""
+        buffer = AccessLogBuffer(lambda: session_factory(bind=db_connection))
+        buffer.put(sample_report_id, 1, "view")
+        buffer.stop()
+        logs, total = ReportAccessService.get_report_access_logs(db, sample_report_id)
+        assert total == 1
+        assert logs[0].access_type == "view"
+
 
 # ============================================================================
 # API ENDPOINT TESTS - Skipped due to FastAPI middleware initialization issue